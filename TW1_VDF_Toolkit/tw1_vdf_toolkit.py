@@ -13,16 +13,23 @@ import struct
 import os
 import sys
 import math
+import mmap
 import json
+import re
+import functools
+import bisect
 import base64
 import shutil
 import tempfile
 import time
 import threading
-from io import BytesIO
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import freeze_support
 from pathlib import Path
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict, deque
 from datetime import datetime
+from itertools import chain
 
 try:
     import tkinter as tk
@@ -31,6 +38,12 @@ try:
 except ImportError:
     HAS_TK = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # ╔═══════════════════════════════════════════════════════════════════════════════╗
 # ║  THEME                                                                       ║
 # ╚═══════════════════════════════════════════════════════════════════════════════╝
@@ -49,6 +62,9 @@ RED      = "#e05050"
 CYAN     = "#4cc9f0"
 ORANGE   = "#f0a040"
 
+ED_ROW_HEIGHT = 26   # px per chunk row in the editor detail list
+ED_COL_X = (8, 152, 240)   # x of the name / type / value columns in that list
+
 VERSION = "1.0"
 CONFIG_FILE = "toolkit_config.json"
 DEFAULT_METADATA_DIR = "vdf_metadata"
@@ -64,6 +80,8 @@ KNOWN_SHADERS = [
 DEFAULT_SHADER = "buildings_lmap"
 DEFAULT_NEAR_RANGE = 0.0
 DEFAULT_FAR_RANGE = 100.0
+# Batch import workers; conversion is memory-bound, so more than ~4 rarely helps
+IMPORT_MAX_WORKERS = min(4, os.cpu_count() or 1)
 
 # ╔═══════════════════════════════════════════════════════════════════════════════╗
 # ║  NTF BINARY FORMAT — Entry-Order Preserving Parser & Writer                  ║
@@ -89,7 +107,8 @@ CHILD_SHADER  = -253
 CHILD_MESH    = -254
 CHILD_LOCATOR = 5
 
-TEXTURE_FIELDS = {"TexS0", "TexS1", "TexS2"}
+TEXTURE_FIELDS = frozenset(("TexS0", "TexS1", "TexS2"))
+EDITABLE_CHUNK_TYPES = frozenset((CHUNK_INT32, CHUNK_UINT32, CHUNK_FLOAT, CHUNK_STRING))
 
 NODE_TYPE_NAMES = {
     -1: "Root / AnimRef", -253: "Shader", -254: "FrameData (A)",
@@ -99,37 +118,35 @@ NODE_TYPE_NAMES = {
 ENTRY_CHUNK = 'chunk'
 ENTRY_CHILD = 'child'
 
-
-class BinaryReader:
-    __slots__ = ('data', 'offset')
-    def __init__(self, data):
-        self.data = data; self.offset = 0
-    def is_end(self): return self.offset >= len(self.data)
-    def read(self, n):
-        r = self.data[self.offset:self.offset+n]; self.offset += n; return r
-    def uint8(self):   return struct.unpack_from('<B', self.read(1))[0]
-    def int32(self):   return struct.unpack_from('<i', self.read(4))[0]
-    def uint32(self):  return struct.unpack_from('<I', self.read(4))[0]
-    def float32(self): return struct.unpack_from('<f', self.read(4))[0]
-    def dstr(self):
-        length = self.uint32()
-        return self.read(length).decode('ascii', errors='replace')
-    def slice_to(self, end):
-        d = self.data[self.offset:end]; self.offset = end; return BinaryReader(d)
-    def read_to(self, end):
-        d = self.data[self.offset:end]; self.offset = end; return d
+_U8 = struct.Struct('<B')
+_U32 = struct.Struct('<I')
+_I32 = struct.Struct('<i')
+_F32 = struct.Struct('<f')
+_CHUNK_HDR = struct.Struct('<BIBI')   # marker 1, size, chunk type, name length
+_CHILD_HDR = struct.Struct('<BIi')    # marker 2, size, child type
+_ENTRY_HDR = struct.Struct('<BI')     # marker, size / chunk type, name length
+_4I32 = struct.Struct('<4i')
+_4F32 = struct.Struct('<4f')
+_16F32 = struct.Struct('<16f')
 
 
 class BinaryWriter:
-    def __init__(self): self.buf = BytesIO()
-    def write(self, d): self.buf.write(d)
-    def uint8(self, v):   self.buf.write(struct.pack('<B', v))
-    def int32(self, v):   self.buf.write(struct.pack('<i', v))
-    def uint32(self, v):  self.buf.write(struct.pack('<I', v))
-    def float32(self, v): self.buf.write(struct.pack('<f', v))
+    """Appends to a plain bytearray; size fields written ahead of their
+    content are reserved with `mark()` and filled in by `patch()`."""
+    __slots__ = ('buf',)
+    def __init__(self): self.buf = bytearray()
+    def write(self, d): self.buf += d
+    def uint8(self, v):   self.buf += _U8.pack(v)
+    def int32(self, v):   self.buf += _I32.pack(v)
+    def uint32(self, v):  self.buf += _U32.pack(v)
+    def float32(self, v): self.buf += _F32.pack(v)
     def dstr(self, s):
-        raw = s.encode('ascii'); self.uint32(len(raw)); self.buf.write(raw)
-    def get_bytes(self): return self.buf.getvalue()
+        raw = s.encode('ascii'); self.uint32(len(raw)); self.buf += raw
+    def mark(self):
+        sp = len(self.buf); self.buf += b'\0\0\0\0'; return sp
+    def patch(self, sp):
+        _U32.pack_into(self.buf, sp, len(self.buf) - sp)
+    def get_bytes(self): return bytes(self.buf)
 
 
 class ChunkData:
@@ -152,8 +169,15 @@ class ChunkData:
     def clone(self):
         val = self.value
         if isinstance(val, list): val = list(val)
-        elif isinstance(val, (bytes, bytearray)): val = bytes(val)
-        return ChunkData(self.chunk_type, self.name, val)
+        elif isinstance(val, bytearray): val = bytes(val)   # bytes are immutable, shared as-is
+        c = object.__new__(ChunkData)   # skip __init__; slots are set directly
+        c.chunk_type = self.chunk_type; c.name = self.name; c.value = val
+        return c
+
+
+def _clone_entries(chunks, _E=ENTRY_CHUNK, _clone=ChunkData.clone):
+    """Fresh (ENTRY_CHUNK, copy) entries for a list of chunks."""
+    return [(_E, _clone(c)) for c in chunks]
 
 
 class NTFNode:
@@ -201,37 +225,50 @@ class NTFNode:
 
 # ── Parse / Write NTF ─────────────────────────────────────────────────────────
 
-def parse_node_list(reader, node_type=None):
-    node = NTFNode(node_type)
-    while not reader.is_end():
-        flag = reader.uint8()
-        start = reader.offset
-        size = reader.uint32()
-        if flag == 1:
-            ct = reader.uint8(); name = reader.dstr()
-            if ct == 17:   val = reader.int32()
-            elif ct == 18: val = reader.uint32()
-            elif ct == 19: val = reader.float32()
-            elif ct == 20:
-                val = [reader.int32() for _ in range(4)] if name == "LPos" else [reader.float32() for _ in range(4)]
-            elif ct == 21: val = [reader.float32() for _ in range(16)]
-            elif ct == 22: val = reader.read_to(start + size).decode('ascii', errors='replace')
-            elif ct == 23: val = reader.read_to(start + size)
-            else: val = reader.read_to(start + size)
-            node.add_chunk(ChunkData(ct, name, val))
-        elif flag == 2:
-            child_type = reader.int32()
-            node.add_child(parse_node_list(reader.slice_to(start + size), child_type))
-        else:
-            reader.offset = start + size
-    return node
+def parse_node_list(data, node_type=None):
+    """Parse a node list (a buffer, without the file magic) into an NTFNode.
+    Children are queued on a stack as views of their own span instead of
+    being parsed recursively; fields are unpacked at a local offset."""
+    root = NTFNode(node_type); buf = data = memoryview(data); stack = [(root, data)]
+    hdr = _ENTRY_HDR.unpack_from
+    try:
+        while stack:
+            node, buf = stack.pop(); add = node.entries.append
+            pos = 0; end = len(buf)
+            while pos < end:
+                flag, size = hdr(buf, pos)
+                start = pos + 1; stop = start + size; pos += 5
+                if flag == 1:
+                    ct, n = hdr(buf, pos); pos += 5
+                    name = str(buf[pos:pos+n], 'ascii', 'replace'); pos += n
+                    if ct == 17:   val = _I32.unpack_from(buf, pos)[0]; pos += 4
+                    elif ct == 18: val = _U32.unpack_from(buf, pos)[0]; pos += 4
+                    elif ct == 19: val = _F32.unpack_from(buf, pos)[0]; pos += 4
+                    elif ct == 20:
+                        val = list((_4I32 if name == "LPos" else _4F32).unpack_from(buf, pos)); pos += 16
+                    elif ct == 21: val = list(_16F32.unpack_from(buf, pos)); pos += 64
+                    elif ct == 22: val = sys.intern(str(buf[pos:stop], 'ascii', 'replace')); pos = stop
+                    else: val = bytes(buf[pos:stop]); pos = stop
+                    add((ENTRY_CHUNK, ChunkData(ct, name, val)))
+                elif flag == 2:
+                    child = NTFNode(_I32.unpack_from(buf, pos)[0]); add((ENTRY_CHILD, child))
+                    stack.append((child, buf[pos+4:stop])); pos = stop
+                else:
+                    pos = stop
+    finally:
+        # Release the span views even when parsing fails: the traceback would
+        # otherwise keep them, and the mmap behind them, alive.
+        for _, b in stack: b.release()
+        buf.release(); data.release()
+    return root
 
 
 def parse_ntf_bytes(data):
-    """Parse NTF from raw bytes. Returns root NTFNode."""
+    """Parse NTF from raw bytes (or any buffer, e.g. an mmap). Returns root NTFNode.
+    The reader works on memoryview slices, so nested nodes are not copied."""
     if data[:4] != HEADER_MAGIC:
-        raise ValueError(f"Invalid NTF header: {data[:4].hex()}")
-    root = parse_node_list(BinaryReader(data[4:]))
+        raise ValueError(f"Invalid NTF header: {bytes(data[:4]).hex()}")
+    root = parse_node_list(memoryview(data)[4:])
     while len(root.children) == 1 and len(root.chunks) == 0:
         root = root.children[0]
     return root
@@ -240,12 +277,19 @@ def parse_ntf_bytes(data):
 def parse_ntf_file(filepath):
     """Parse NTF from file path. Returns root NTFNode."""
     with open(filepath, 'rb') as f:
-        data = f.read()
-    return parse_ntf_bytes(data)
+        if os.fstat(f.fileno()).st_size == 0: return parse_ntf_bytes(b'')
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return parse_ntf_bytes(mm)
+    finally:
+        mm.close()   # parse_node_list has released every view into it
 
 
-def write_chunk_bytes(chunk):
-    w = BinaryWriter(); w.uint8(chunk.chunk_type); w.dstr(chunk.name)
+def write_chunk_bytes(chunk, w=None):
+    """Chunk body (type, name, value); appended to `w` if one is given."""
+    own = w is None
+    if own: w = BinaryWriter()
+    w.uint8(chunk.chunk_type); w.dstr(chunk.name)
     ct = chunk.chunk_type
     if ct == 17:   w.int32(chunk.value)
     elif ct == 18: w.uint32(chunk.value)
@@ -256,51 +300,88 @@ def write_chunk_bytes(chunk):
         for v in chunk.value: w.float32(v)
     elif ct == 22: w.write(chunk.value.encode('ascii'))
     elif ct == 23: w.write(chunk.value)
-    return w.get_bytes()
+    if own: return w.get_bytes()
 
 
-def write_node_list(node):
-    r = BinaryWriter()
+def write_node_list(node, strip=(), w=None):
+    """Serialize a node's entries. Chunks named in `strip` are written with an
+    empty payload (used for metadata skeletons). The whole tree goes into one
+    writer; each size field is patched once its content is written."""
+    own = w is None
+    if own: w = BinaryWriter()
     for et, data in node.entries:
         if et == ENTRY_CHUNK:
-            cb = write_chunk_bytes(data); r.uint8(1); r.uint32(len(cb)+4); r.write(cb)
+            if data.name in strip: data = ChunkData(data.chunk_type, data.name, b'')
+            w.uint8(1); sp = w.mark(); write_chunk_bytes(data, w); w.patch(sp)
         elif et == ENTRY_CHILD:
-            cb = write_node_list(data); r.uint8(2); r.uint32(4+4+len(cb))
-            r.int32(data.node_type if data.node_type is not None else -1); r.write(cb)
-    return r.get_bytes()
+            w.uint8(2); sp = w.mark()
+            w.int32(data.node_type if data.node_type is not None else -1)
+            write_node_list(data, strip, w); w.patch(sp)
+    if own: return w.get_bytes()
 
 
-def ntf_to_bytes(root):
+def ntf_to_bytes(root, strip=()):
     """Serialize NTF node tree to bytes."""
-    content = write_node_list(root)
-    buf = BytesIO()
-    buf.write(HEADER_MAGIC)
-    if root.node_type is not None:
-        buf.write(struct.pack('<B', 2))
-        buf.write(struct.pack('<I', 4+4+len(content)))
-        buf.write(struct.pack('<i', root.node_type))
-    buf.write(content)
-    return buf.getvalue()
+    w = BinaryWriter(); w.write(HEADER_MAGIC)
+    if root.node_type is None: write_node_list(root, strip, w)
+    else:
+        w.uint8(2); sp = w.mark(); w.int32(root.node_type)
+        write_node_list(root, strip, w); w.patch(sp)
+    return w.get_bytes()
+
+
+# os.umask can only be read by setting it; do that once, before any threads
+_UMASK = os.umask(0); os.umask(_UMASK)
+
+def _replace_file(path, fill):
+    """Write path through a temp file in the same folder and os.replace it in,
+    so readers and concurrent writers only ever see a complete file. `fill(f)`
+    writes the content. An existing file keeps its mode; a new one gets the
+    umask-based mode a plain open() would give."""
+    try: mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError: mode = 0o666 & ~_UMASK
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp',
+                               dir=os.path.dirname(path) or '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            fill(f)
+        os.chmod(tmp, mode)   # mkstemp creates 0600
+        os.replace(tmp, path)
+    except BaseException:
+        try: os.unlink(tmp)
+        except OSError: pass
+        raise
 
 
 def save_ntf(filepath, root):
-    with open(filepath, 'wb') as f:
-        f.write(ntf_to_bytes(root))
+    """Write a tree (or its already-serialized bytes) atomically."""
+    data = root if isinstance(root, (bytes, bytearray)) else ntf_to_bytes(root)
+    _replace_file(filepath, lambda f: f.write(data))
 
 
 def verify_roundtrip(filepath, root):
-    with open(filepath, 'rb') as f:
-        orig = f.read()
+    """True if re-serializing root reproduces filepath byte for byte. The file
+    is compared in 1 MiB blocks instead of being read into memory whole."""
     saved = ntf_to_bytes(root)
-    return orig == saved
+    if os.path.getsize(filepath) != len(saved): return False
+    pos = 0
+    with open(filepath, 'rb') as f:
+        while True:
+            block = f.read(1 << 20)
+            if not block: return pos == len(saved)
+            if not saved.startswith(block, pos): return False
+            pos += len(block)
 
 
 # ── NTF Tree Helpers ──────────────────────────────────────────────────────────
 
 def find_nodes(node, pred, res=None):
     if res is None: res = []
-    if pred(node): res.append(node)
-    for ch in node.children: find_nodes(ch, pred, res)
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if pred(n): res.append(n)
+        stack.extend(reversed(n.children))  # reversed keeps pre-order
     return res
 
 def find_shaders(root): return find_nodes(root, lambda n: n.node_type == -253)
@@ -461,11 +542,16 @@ class ObjMaterial:
         self.map_kd = ""; self.map_bump = ""; self.map_ka = ""
 
 class ObjGroup:
-    __slots__ = ('name', 'material_name', 'faces')
+    # Triangles are stored flat: `corners` holds three (vi, vti, vni) tuples
+    # per triangle, so parsing appends no per-triangle tuple.
+    __slots__ = ('name', 'material_name', 'corners')
     def __init__(self, name, material_name=""):
-        self.name = name; self.material_name = material_name; self.faces = []
+        self.name = name; self.material_name = material_name; self.corners = []
 
 class ObjData:
+    # positions/normals/uvs stay lists of tuples: process_group gathers whole
+    # tuples per unique corner.
+    __slots__ = ('positions','normals','uvs','groups','materials')
     def __init__(self):
         self.positions = []; self.normals = []; self.uvs = []
         self.groups = []; self.materials = {}
@@ -477,6 +563,19 @@ def _parse_floats(text, count):
         return vals if len(vals) == count else None
     except ValueError: return None
 
+def _parse_vec_tails(tails, count):
+    """_parse_floats over a whole v/vn/vt bucket: one comprehension when every
+    line splits cleanly, falling back to per-line parsing (skipping bad lines)."""
+    try:
+        if count == 3: return [(float(a), float(b), float(c)) for a, b, c, *_ in map(str.split, tails)]
+        return [(float(a), float(b)) for a, b, *_ in map(str.split, tails)]
+    except ValueError: pass
+    out = []
+    for val in tails:
+        c = _parse_floats(val, count)
+        if c: out.append(tuple(c))
+    return out
+
 def _extract_filename(val):
     parts = val.strip().split()
     i = 0
@@ -520,83 +619,98 @@ def parse_mtl(mtl_path):
     return materials
 
 
-def _parse_face(val):
-    verts = []
-    for token in val.split():
-        parts = token.split('/')
-        try: vi = int(parts[0]) - 1
-        except (ValueError, IndexError): continue
-        vti = vni = -1
-        if len(parts) > 1 and parts[1]:
-            try: vti = int(parts[1]) - 1
-            except ValueError: pass
-        if len(parts) > 2 and parts[2]:
-            try: vni = int(parts[2]) - 1
-            except ValueError: pass
-        verts.append((vi, vti, vni))
-    return verts
+def _parse_corner(token):
+    """(vi, vti, vni) of one face token, zero-based with -1 for missing
+    fields; None when the position index itself is malformed."""
+    parts = token.split('/')
+    try: vi = int(parts[0]) - 1
+    except (ValueError, IndexError): return None
+    vti = vni = -1
+    if len(parts) > 1 and parts[1]:
+        try: vti = int(parts[1]) - 1
+        except ValueError: pass
+    if len(parts) > 2 and parts[2]:
+        try: vni = int(parts[2]) - 1
+        except ValueError: pass
+    return (vi, vti, vni)
+
+def _parse_face(val, cache=None):
+    # Every vertex is shared by several faces, so a token -> corner cache
+    # kept for the whole file turns most corners into one dict lookup.
+    if cache is None: cache = {}
+    get = cache.get; remember = cache.setdefault
+    verts = [get(t) or remember(t, _parse_corner(t)) for t in val.split()]
+    return [c for c in verts if c is not None] if None in verts else verts
 
 
 def _merge_groups_by_material(groups):
-    merged = OrderedDict()
+    # Corner lists are gathered per key and joined once; a key with a single
+    # group keeps that group's list as is instead of copying it.
+    parts = OrderedDict()
     for g in groups:
         key = g.material_name if g.material_name else g.name
-        if key in merged: merged[key].faces.extend(g.faces)
-        else:
-            new_g = ObjGroup(g.name, g.material_name)
-            new_g.faces = list(g.faces); merged[key] = new_g
-    return list(merged.values())
+        if key in parts: parts[key][1].append(g.corners)
+        else: parts[key] = (g, [g.corners])
+    merged = []
+    for g, lists in parts.values():
+        new_g = ObjGroup(g.name, g.material_name)
+        new_g.corners = lists[0] if len(lists) == 1 else list(chain.from_iterable(lists))
+        merged.append(new_g)
+    return merged
+
 
+_OBJ_BULK_KEYS = frozenset(('v', 'vn', 'vt', 'f'))
+
+def _log_noop(msg):
+    """Stand-in logger when no log_func is given (saves a branch per call)."""
 
 def parse_obj(obj_path, log_func=None):
-    def log(msg):
-        if log_func: log_func(msg)
+    log = log_func or _log_noop
     data = ObjData(); current_group = None; current_material = ""
     obj_dir = os.path.dirname(obj_path); mtl_libs = []
-    with open(obj_path, 'r', errors='replace') as f:
-        for line in f:
+    v_tails = []; vn_tails = []; vt_tails = []; corners = {}
+    with open(obj_path, 'r', errors='replace') as f: lines = f.read().split('\n')
+    for line in lines:
+        # v/vn/vt/f lines written as "key value..." (nearly all of them) are
+        # split with one partition; anything else takes the strip/split path.
+        key, _, val = line.partition(' ')
+        if key not in _OBJ_BULK_KEYS:
             line = line.strip()
             if not line or line.startswith('#'): continue
             parts = line.split(None, 1)
             key = parts[0]; val = parts[1] if len(parts) > 1 else ""
-            if key == 'v':
-                c = _parse_floats(val, 3)
-                if c: data.positions.append(tuple(c))
-            elif key == 'vn':
-                c = _parse_floats(val, 3)
-                if c: data.normals.append(tuple(c))
-            elif key == 'vt':
-                c = _parse_floats(val, 2)
-                if c: data.uvs.append(tuple(c))
-                else:
-                    c = _parse_floats(val, 3)
-                    if c: data.uvs.append((c[0], c[1]))
-            elif key == 'mtllib':
-                mp = os.path.join(obj_dir, val.strip())
-                if os.path.isfile(mp): mtl_libs.append(mp)
-            elif key == 'usemtl':
-                current_material = val.strip()
-                gn = current_group.name if current_group else "default"
-                current_group = ObjGroup(gn, current_material)
+        if key == 'v': v_tails.append(val)
+        elif key == 'vn': vn_tails.append(val)
+        elif key == 'vt': vt_tails.append(val)
+        elif key == 'f':
+            if current_group is None:
+                current_group = ObjGroup("default", current_material)
                 data.groups.append(current_group)
-            elif key in ('g', 'o'):
-                gn = val.strip() if val.strip() else "default"
-                current_group = ObjGroup(gn, current_material)
-                data.groups.append(current_group)
-            elif key == 'f':
-                if current_group is None:
-                    current_group = ObjGroup("default", current_material)
-                    data.groups.append(current_group)
-                face_verts = _parse_face(val)
-                if len(face_verts) < 3: continue
-                for i in range(1, len(face_verts) - 1):
-                    current_group.faces.append((face_verts[0], face_verts[i], face_verts[i+1]))
+            face_verts = _parse_face(val, corners)
+            if len(face_verts) == 3: current_group.corners.extend(face_verts); continue
+            for i in range(1, len(face_verts) - 1):
+                current_group.corners.extend((face_verts[0], face_verts[i], face_verts[i+1]))
+        elif key == 'mtllib':
+            mp = os.path.join(obj_dir, val.strip())
+            if os.path.isfile(mp): mtl_libs.append(mp)
+        elif key == 'usemtl':
+            current_material = val.strip()
+            gn = current_group.name if current_group else "default"
+            current_group = ObjGroup(gn, current_material)
+            data.groups.append(current_group)
+        elif key in ('g', 'o'):
+            gn = val.strip() if val.strip() else "default"
+            current_group = ObjGroup(gn, current_material)
+            data.groups.append(current_group)
+    data.positions = _parse_vec_tails(v_tails, 3)
+    data.normals = _parse_vec_tails(vn_tails, 3)
+    data.uvs = _parse_vec_tails(vt_tails, 2)
     for mp in mtl_libs:
         log(f"  Parsing {os.path.basename(mp)}...")
         data.materials.update(parse_mtl(mp))
-    data.groups = [g for g in data.groups if g.faces]
+    data.groups = [g for g in data.groups if g.corners]
     data.groups = _merge_groups_by_material(data.groups)
-    log(f"  OBJ: {len(data.positions)} pos, {len(data.normals)} nrm, {len(data.uvs)} uv, {len(data.groups)} groups")
+    if log_func: log(f"  OBJ: {len(data.positions)} pos, {len(data.normals)} nrm, {len(data.uvs)} uv, {len(data.groups)} groups")
     return data
 
 
@@ -613,23 +727,18 @@ class ProcessedMesh:
 
 
 def process_group(obj_data, group, log_func=None):
-    def log(msg):
-        if log_func: log_func(msg)
+    log = log_func or _log_noop
     mesh = ProcessedMesh()
     mesh.name = group.name; mesh.material_name = group.material_name
-    vertex_map = {}; unique_pos = []; unique_nrm = []; unique_uv = []; new_idx = []
-    for tri in group.faces:
-        tri_idx = []
-        for vi, vti, vni in tri:
-            key = (vi, vti, vni)
-            if key in vertex_map:
-                tri_idx.append(vertex_map[key])
-            else:
-                idx = len(unique_pos); vertex_map[key] = idx; tri_idx.append(idx)
-                unique_pos.append(obj_data.positions[vi] if 0<=vi<len(obj_data.positions) else (0,0,0))
-                unique_nrm.append(obj_data.normals[vni] if 0<=vni<len(obj_data.normals) else (0,1,0))
-                unique_uv.append(obj_data.uvs[vti] if 0<=vti<len(obj_data.uvs) else (0,0))
-        new_idx.extend(tri_idx)
+    # Corners are (vi, vti, vni) tuples already, so they key the dedupe map
+    # directly; setdefault hands out indices in first-seen order.
+    vertex_map = {}; assign = vertex_map.setdefault
+    new_idx = [assign(c, len(vertex_map)) for c in group.corners]
+    P = obj_data.positions; N = obj_data.normals; UV = obj_data.uvs
+    nP = len(P); nN = len(N); nUV = len(UV)
+    unique_pos = [P[vi] if 0<=vi<nP else (0,0,0) for vi, _, _ in vertex_map]
+    unique_nrm = [N[vni] if 0<=vni<nN else (0,1,0) for _, _, vni in vertex_map]
+    unique_uv = [UV[vti] if 0<=vti<nUV else (0,0) for _, vti, _ in vertex_map]
     nv = len(unique_pos)
     if nv > 65535:
         log(f"    WARNING: '{group.name}' has {nv} verts (>65535)!")
@@ -637,37 +746,40 @@ def process_group(obj_data, group, log_func=None):
     mesh.uvs1 = unique_uv; mesh.uvs2 = [(0,0)]*nv
     mesh.indices = new_idx
     mesh.tangents = _calculate_tangents(unique_pos, unique_nrm, unique_uv, new_idx)
-    log(f"    Group '{mesh.name}': {nv} verts, {len(new_idx)//3} tris")
+    if log_func: log(f"    Group '{mesh.name}': {nv} verts, {len(new_idx)//3} tris")
     return mesh
 
 
 def _calculate_tangents(positions, normals, uvs, indices):
+    # Per-axis flat accumulators and tuple unpacking keep the per-triangle
+    # loop on locals; the arithmetic (and summation order) is unchanged.
     nv = len(positions)
-    tan_acc = [[0.0,0.0,0.0] for _ in range(nv)]
-    for t in range(len(indices)//3):
-        i0,i1,i2 = indices[t*3], indices[t*3+1], indices[t*3+2]
-        p0,p1,p2 = positions[i0], positions[i1], positions[i2]
-        uv0,uv1,uv2 = uvs[i0], uvs[i1], uvs[i2]
-        dx1,dy1,dz1 = p1[0]-p0[0], p1[1]-p0[1], p1[2]-p0[2]
-        dx2,dy2,dz2 = p2[0]-p0[0], p2[1]-p0[1], p2[2]-p0[2]
-        du1,dv1 = uv1[0]-uv0[0], uv1[1]-uv0[1]
-        du2,dv2 = uv2[0]-uv0[0], uv2[1]-uv0[1]
+    ax = [0.0]*nv; ay = [0.0]*nv; az = [0.0]*nv
+    it = iter(indices)
+    for i0, i1, i2 in zip(it, it, it):
+        x0,y0,z0 = positions[i0]; x1,y1,z1 = positions[i1]; x2,y2,z2 = positions[i2]
+        u0,v0 = uvs[i0]; u1,v1 = uvs[i1]; u2,v2 = uvs[i2]
+        dx1,dy1,dz1 = x1-x0, y1-y0, z1-z0
+        dx2,dy2,dz2 = x2-x0, y2-y0, z2-z0
+        du1,dv1 = u1-u0, v1-v0
+        du2,dv2 = u2-u0, v2-v0
         denom = du1*dv2 - du2*dv1
         if abs(denom) < 1e-10: continue
         r = 1.0/denom
         tx = (dv2*dx1 - dv1*dx2)*r
         ty = (dv2*dy1 - dv1*dy2)*r
         tz = (dv2*dz1 - dv1*dz2)*r
-        for idx in (i0,i1,i2):
-            tan_acc[idx][0] += tx; tan_acc[idx][1] += ty; tan_acc[idx][2] += tz
-    tangents = []
-    for i in range(nv):
-        n = normals[i]; t = tan_acc[i]
-        dot_nt = n[0]*t[0]+n[1]*t[1]+n[2]*t[2]
-        tx,ty,tz = t[0]-n[0]*dot_nt, t[1]-n[1]*dot_nt, t[2]-n[2]*dot_nt
-        length = math.sqrt(tx*tx+ty*ty+tz*tz)
-        if length > 1e-10: tangents.append((tx/length, ty/length, tz/length))
-        else: tangents.append(_arbitrary_tangent(n))
+        ax[i0] += tx; ay[i0] += ty; az[i0] += tz
+        ax[i1] += tx; ay[i1] += ty; az[i1] += tz
+        ax[i2] += tx; ay[i2] += ty; az[i2] += tz
+    tangents = []; append = tangents.append; sqrt = math.sqrt
+    for n, sx, sy, sz in zip(normals, ax, ay, az):
+        nx,ny,nz = n
+        dot_nt = nx*sx+ny*sy+nz*sz
+        tx,ty,tz = sx-nx*dot_nt, sy-ny*dot_nt, sz-nz*dot_nt
+        length = sqrt(tx*tx+ty*ty+tz*tz)
+        if length > 1e-10: append((tx/length, ty/length, tz/length))
+        else: append(_arbitrary_tangent(n))
     return tangents
 
 
@@ -686,20 +798,30 @@ def encode_ubyte4n(x,y,z,w=1.0):
     def f2b(f): return max(0, min(255, int(round(f*127.0+128.0))))
     return struct.pack('<4B', f2b(x), f2b(y), f2b(z), f2b(w))
 
+_VERTEX_FMT1 = struct.Struct('<3f8B4f')   # pos, normal + tangent UBYTE4N, uv1, uv2 (36 bytes)
+
+def _ubyte4n_bytes(vecs):
+    """encode_ubyte4n's byte for every component of every vector, flattened."""
+    return [255 if b > 255 else (0 if b < 0 else b) for b in [round(f*127.0+128.0) for v in vecs for f in v]]
+
 def encode_vertex_buffer(mesh):
-    buf = bytearray()
-    for i in range(len(mesh.positions)):
-        px,py,pz = mesh.positions[i]; nx,ny,nz = mesh.normals[i]
-        tx,ty,tz = mesh.tangents[i]; u1,v1 = mesh.uvs1[i]; u2,v2 = mesh.uvs2[i]
-        buf += struct.pack('<3f', px,py,pz)
-        buf += encode_ubyte4n(nx,ny,nz,1.0)
-        buf += encode_ubyte4n(tx,ty,tz,1.0)
-        buf += struct.pack('<2f', u1,v1)
-        buf += struct.pack('<2f', u2,v2)
-    return bytes(buf)
+    # Normals/tangents are quantized in two bulk passes, then each vertex is
+    # one pack of the combined 36-byte layout (w bytes are 1.0 -> 255).
+    # join sizes the result once, so nothing is regrown; a preallocated
+    # bytearray + pack_into measured slower than this.
+    nq = iter(_ubyte4n_bytes(mesh.normals)); tq = iter(_ubyte4n_bytes(mesh.tangents))
+    pack = _VERTEX_FMT1.pack
+    return b''.join([pack(px,py,pz, n0,n1,n2,255, t0,t1,t2,255, u1,v1, u2,v2)
+                     for (px,py,pz), n0,n1,n2, t0,t1,t2, (u1,v1), (u2,v2)
+                     in zip(mesh.positions, nq,nq,nq, tq,tq,tq, mesh.uvs1, mesh.uvs2)])
 
 def encode_face_buffer(indices):
-    return struct.pack(f'<{len(indices)}H', *indices)
+    # One splatted pack measured faster than array('H').tobytes(); the range
+    # check rides on struct's own error instead of a separate max() pass.
+    try: return struct.pack(f'<{len(indices)}H', *indices)
+    except struct.error:
+        raise ValueError(f"Face index {max(indices)} exceeds 16-bit range "
+                         f"(meshes are limited to 65536 vertices)") from None
 
 
 # ╔═══════════════════════════════════════════════════════════════════════════════╗
@@ -741,26 +863,18 @@ def write_mtl(filepath, materials):
 # ║  METADATA JSON — NTF skeleton serialization                                  ║
 # ╚═══════════════════════════════════════════════════════════════════════════════╝
 
+SKELETON_STRIP = frozenset(('Vertexes', 'Faces'))
+
 def create_ntf_skeleton(root):
-    """Create a copy of the NTF tree with Vertexes/Faces binary data stripped.
+    """Serialize the NTF tree with Vertexes/Faces binary data stripped.
     Returns the skeleton as base64-encoded NTF bytes."""
-    def clone_node(node):
-        new = NTFNode(node.node_type)
-        for et, data in node.entries:
-            if et == ENTRY_CHUNK:
-                if data.name in ('Vertexes', 'Faces'):
-                    # Replace with empty bytes marker
-                    new.add_chunk(ChunkData(data.chunk_type, data.name, b''))
-                else:
-                    new.add_chunk(data.clone())
-            elif et == ENTRY_CHILD:
-                new.add_child(clone_node(data))
-        return new
-    skeleton = clone_node(root)
-    raw = ntf_to_bytes(skeleton)
+    # Stripping happens during serialization, so the tree is never cloned.
+    raw = ntf_to_bytes(root, strip=SKELETON_STRIP)
     return base64.b64encode(raw).decode('ascii')
 
 
+_ROUND6 = (6,) * 4
+
 def extract_shader_details(shader_node):
     """Extract all shader properties as a JSON-friendly dict."""
     d = shader_node.data
@@ -776,14 +890,29 @@ def extract_shader_details(shader_node):
         elif c.chunk_type == 19: result[c.name] = round(c.value, 6)
         elif c.chunk_type in (17, 18): result[c.name] = c.value
         elif c.chunk_type == 20:
-            result[c.name] = [round(v,6) if isinstance(v,float) else v for v in c.value]
+            # round() returns ints unchanged, so LPos needs no type check
+            result[c.name] = list(map(round, c.value, _ROUND6))
     return result
 
 
+def _collect_metadata_nodes(root):
+    """Single pre-order walk returning (mesh_nodes, first_locator, first_ani).
+    Same results as find_mesh_nodes + two find_nodes passes."""
+    mesh_nodes = []; locator = ani = None
+    stack = [root]
+    while stack:
+        n = stack.pop(); d = n.data
+        if d.get("Type") == 1 and "Vertexes" in d: mesh_nodes.append(n)
+        if locator is None and d.get("IsLocator"): locator = n
+        if ani is None and "AniFileName" in d: ani = n
+        stack.extend(reversed(n.children))
+    return mesh_nodes, locator, ani
+
+
 def build_metadata_json(root, source_vdf, source_path=""):
     """Build the complete metadata JSON dict from an NTF tree."""
     meshes_info = []
-    mesh_nodes = find_mesh_nodes(root)
+    mesh_nodes, locator_node, ani_node = _collect_metadata_nodes(root)
     total_v = total_t = 0
     for mn in mesh_nodes:
         d = mn.data
@@ -800,24 +929,20 @@ def build_metadata_json(root, source_vdf, source_path=""):
             "shader": {},
             "extra_properties": {}
         }
-        for child in mn.children:
-            if child.node_type == -253:
-                mesh_entry["shader"] = extract_shader_details(child)
-                mesh_entry["name"] = child.data.get("Name", mesh_entry["name"])
-                break
+        shader = next((c for c in mn.children if c.node_type == -253), None)
+        if shader is not None:
+            mesh_entry["shader"] = extract_shader_details(shader)
+            mesh_entry["name"] = shader.data.get("Name", mesh_entry["name"])
         meshes_info.append(mesh_entry)
 
     # Locator info
     locator = {"IsLocator": 1, "LPos": [0,0,0,0]}
-    for n in find_nodes(root, lambda n: n.data.get("IsLocator")):
-        d = n.data
+    if locator_node:
+        d = locator_node.data
         locator["IsLocator"] = d.get("IsLocator", 1)
         if "LPos" in d: locator["LPos"] = d["LPos"]
-        break
 
-    ani = ""
-    for n in find_nodes(root, lambda n: "AniFileName" in n.data):
-        ani = n.data["AniFileName"]; break
+    ani = ani_node.data["AniFileName"] if ani_node else ""
 
     metadata = {
         "toolkit_version": VERSION,
@@ -841,103 +966,187 @@ def restore_ntf_from_metadata(metadata):
     return parse_ntf_bytes(raw)
 
 
+def _json_dumps(obj):
+    """Serialize to indented UTF-8 JSON bytes. Always stdlib json: orjson
+    would write NaN/Infinity floats as null."""
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _json_loads(data):
+    # orjson rejects the NaN/Infinity tokens json.dump writes; fall back for those
+    if HAS_ORJSON:
+        try: return orjson.loads(data)
+        except orjson.JSONDecodeError: pass
+    return json.loads(data)
+
+
 def save_metadata(filepath, metadata):
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    # Replaced atomically: batch-import workers can write the same
+    # {stem}_vdf_metadata.json at once for same-named VDFs in different folders
+    skel = metadata.get("raw_ntf_skeleton")
+    keys = list(metadata)
+    if not isinstance(skel, str) or len(keys) < 2 or keys[-1] != "raw_ntf_skeleton":
+        data = _json_dumps(metadata)
+        _replace_file(filepath, lambda f: f.write(data))
+        return
+    # The base64 skeleton is plain ASCII and by far the largest value: serialize
+    # the rest normally and splice it in as the last key, bypassing the encoder.
+    head = _json_dumps({k: metadata[k] for k in keys[:-1]})
+    def fill(f):
+        f.write(head[:head.rindex(b'}')].rstrip())
+        f.write(b',\n  "raw_ntf_skeleton": "'); f.write(skel.encode('ascii')); f.write(b'"\n}')
+    _replace_file(filepath, fill)
 
 def load_metadata(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return _json_loads(f.read())
 
 
 # ╔═══════════════════════════════════════════════════════════════════════════════╗
 # ║  VDF BUILDER (OBJ → VDF, with optional metadata template)                   ║
 # ╚═══════════════════════════════════════════════════════════════════════════════╝
 
+_IMG_EXTS = frozenset(('.png','.jpg','.jpeg','.tga','.bmp','.tif','.tiff'))
+
+# Materials share a handful of texture names; each is normalized once per run
+@functools.lru_cache(maxsize=1024)
 def _ensure_dds(filename):
     if not filename: return ""
     name = filename.strip()
-    base, ext = os.path.splitext(name)
-    if ext.lower() in ('.png','.jpg','.jpeg','.tga','.bmp','.tif','.tiff'):
-        return base + ".dds"
-    if not ext: return name + ".dds"
+    dot = name.rfind('.')
+    sep = max(name.rfind('/'), name.rfind('\\'))
+    # No extension: dot inside a directory part, or only leading dots (like splitext)
+    if dot <= sep or not name[sep+1:dot].strip('.'): return name + ".dds"
+    if name[dot:].lower() in _IMG_EXTS: return name[:dot] + ".dds"
     return name
 
 
+_CHUNK_STRUCTS = {}   # (value format, name length) -> compiled chunk Struct
+
+def _chunk_struct(vfmt, n):
+    """Compiled Struct for a whole chunk (header, n-byte name, value)."""
+    st = _CHUNK_STRUCTS.get((vfmt, n))
+    if st is None: st = _CHUNK_STRUCTS[(vfmt, n)] = struct.Struct(f'<BIBI{n}s{vfmt}')
+    return st
+
+
+class NTFBuilder:
+    """Append-only NTF writer for the from-scratch builders. Each typed
+    method packs marker, size, type, name and value with one compiled Struct,
+    directly into a buffer preallocated from `size_hint` (grown if short)."""
+    def __init__(self, size_hint=0):
+        self.buf = bytearray(max(size_hint, 64)); self.off = 4
+        _U32.pack_into(self.buf, 0, NTF_MAGIC_INT)
+    def _reserve(self, total):
+        off = self.off; end = off + total
+        if end > len(self.buf): self.buf.extend(bytes(max(total, len(self.buf))))
+        self.off = end; return off
+    def raw(self, ct, name_b, payload):
+        n = len(name_b); m = len(payload); off = self._reserve(n + m + 10)
+        _CHUNK_HDR.pack_into(self.buf, off, 1, n + m + 9, ct, n); off += 10
+        self.buf[off:off + n] = name_b; self.buf[off + n:off + n + m] = payload
+    def string(self, name_b, s):
+        self.raw(CHUNK_STRING, name_b, s.encode('ascii', errors='replace'))
+    def int32(self, name_b, v):
+        n = len(name_b); st = _chunk_struct('i', n)
+        st.pack_into(self.buf, self._reserve(st.size), 1, n + 13, CHUNK_INT32, n, name_b, v)
+    def uint32(self, name_b, v):
+        n = len(name_b); st = _chunk_struct('I', n)
+        st.pack_into(self.buf, self._reserve(st.size), 1, n + 13, CHUNK_UINT32, n, name_b, v)
+    def float32(self, name_b, v):
+        n = len(name_b); st = _chunk_struct('f', n)
+        st.pack_into(self.buf, self._reserve(st.size), 1, n + 13, CHUNK_FLOAT, n, name_b, v)
+    def vec4f(self, name_b, v):
+        n = len(name_b); st = _chunk_struct('4f', n)
+        st.pack_into(self.buf, self._reserve(st.size), 1, n + 25, CHUNK_VEC4, n, name_b, *v)
+    def vec4i(self, name_b, v):
+        n = len(name_b); st = _chunk_struct('4i', n)
+        st.pack_into(self.buf, self._reserve(st.size), 1, n + 25, CHUNK_VEC4, n, name_b, *v)
+    def begin_child(self, child_type):
+        sp = self._reserve(9) + 1; _CHILD_HDR.pack_into(self.buf, sp - 1, 2, 0, child_type); return sp
+    def end_child(self, sp):
+        _U32.pack_into(self.buf, sp, self.off - sp)
+    def get_bytes(self):
+        del self.buf[self.off:]; return bytes(self.buf)
+
+
+def _emit_shader_child(w, mat, mat_name, shader_name, textures, near_range, far_range):
+    """Write one Shader child, as found under VDF meshes and in MTR files."""
+    sp = w.begin_child(CHILD_SHADER)
+    w.string(b"Name", mat_name)
+    w.string(b"ShaderName", shader_name)
+    w.string(b"TexS0", textures[0])
+    w.string(b"TexS1", textures[1])
+    w.string(b"TexS2", textures[2])
+    w.vec4f(b"SpecColor", (mat.ks[0],mat.ks[1],mat.ks[2],mat.ns) if mat else (0.5,0.5,0.5,16.0))
+    w.vec4f(b"DestColor", (mat.kd[0],mat.kd[1],mat.kd[2],mat.alpha) if mat else (0.5,0.5,0.5,1.0))
+    w.float32(b"Alpha", mat.alpha if mat else 1.0)
+    w.float32(b"NearRange", near_range)
+    w.float32(b"FarRange", far_range)
+    w.end_child(sp)
+
+
+def _material_textures(mat):
+    """(TexS0, TexS1, TexS2) names derived from an OBJ material."""
+    return (_ensure_dds(mat.map_kd), _ensure_dds(mat.map_bump), _ensure_dds(mat.map_ka)) if mat else ("", "", "")
+
+
 def build_vdf_from_scratch(meshes, materials, shader_name=DEFAULT_SHADER,
                            near_range=DEFAULT_NEAR_RANGE, far_range=DEFAULT_FAR_RANGE,
                            texture_overrides=None):
     """Build VDF binary from scratch (no metadata template)."""
-    w = BytesIO()
-    w.write(struct.pack('<I', NTF_MAGIC_INT))
-
-    def write_chunk(ct, name, payload):
-        name_b = name.encode('ascii', errors='replace')
-        content = struct.pack('<B', ct) + struct.pack('<I', len(name_b)) + name_b + payload
-        w.write(b'\x01')
-        w.write(struct.pack('<I', len(content)+4))
-        w.write(content)
-
-    def begin_child(child_type):
-        w.write(b'\x02')
-        sp = w.tell(); w.write(struct.pack('<I', 0))
-        w.write(struct.pack('<i', child_type))
-        return sp
+    return build_vdf_and_mtr(meshes, materials, shader_name, near_range, far_range,
+                             texture_overrides, with_mtr=False)[0]
 
-    def end_child(sp):
-        end = w.tell()
-        w.seek(sp); w.write(struct.pack('<I', end - sp)); w.seek(end)
 
-    write_chunk(CHUNK_STRING, "AniFileName", b"")
+def build_vdf_and_mtr(meshes, materials, shader_name=DEFAULT_SHADER,
+                      near_range=DEFAULT_NEAR_RANGE, far_range=DEFAULT_FAR_RANGE,
+                      texture_overrides=None, with_mtr=True):
+    """(vdf_bytes, mtr_bytes) from one walk over the meshes: each material is
+    looked up and its textures derived once for both files. mtr_bytes is None
+    unless `with_mtr`; it matches build_mtr's output."""
+    encoded = [(encode_vertex_buffer(m), encode_face_buffer(m.indices)) for m in meshes]
+    w = NTFBuilder(4096 + sum(len(vb) + len(fb) + 512 for vb, fb in encoded))
+    mtr = NTFBuilder(256 * len(meshes)) if with_mtr else None
+    w.string(b"AniFileName", "")
 
     # Locator
-    lp = begin_child(CHILD_LOCATOR)
-    write_chunk(CHUNK_INT32, "IsLocator", struct.pack('<i', 1))
-    write_chunk(CHUNK_VEC4, "LPos", struct.pack('<4i', 0,0,0,0))
-    write_chunk(CHUNK_VEC4, "LDir", struct.pack('<4f', 0,0,0,0))
-    end_child(lp)
+    lp = w.begin_child(CHILD_LOCATOR)
+    w.int32(b"IsLocator", 1)
+    w.vec4i(b"LPos", (0,0,0,0))
+    w.vec4f(b"LDir", (0,0,0,0))
+    w.end_child(lp)
 
     for mi, mesh in enumerate(meshes):
-        mp = begin_child(CHILD_MESH)
-        write_chunk(CHUNK_INT32, "Type", struct.pack('<i', 1))
-        write_chunk(CHUNK_STRING, "Name", mesh.name.encode('ascii', errors='replace'))
-        write_chunk(CHUNK_INT32, "VertexFormat", struct.pack('<i', 1))
-        write_chunk(CHUNK_UINT32, "NumVertexes", struct.pack('<I', len(mesh.positions)))
-        write_chunk(CHUNK_UINT32, "NumFaces", struct.pack('<I', len(mesh.indices)))
-        write_chunk(CHUNK_RAW, "Vertexes", encode_vertex_buffer(mesh))
-        write_chunk(CHUNK_RAW, "Faces", encode_face_buffer(mesh.indices))
-
-        sp = begin_child(CHILD_SHADER)
-        mat = materials.get(mesh.material_name)
-        mat_name = mesh.material_name or mesh.name
+        mp = w.begin_child(CHILD_MESH)
+        w.int32(b"Type", 1)
+        w.string(b"Name", mesh.name)
+        w.int32(b"VertexFormat", 1)
+        w.uint32(b"NumVertexes", len(mesh.positions))
+        w.uint32(b"NumFaces", len(mesh.indices))
+        w.raw(CHUNK_RAW, b"Vertexes", encoded[mi][0])
+        w.raw(CHUNK_RAW, b"Faces", encoded[mi][1])
+
+        mat = materials.get(mesh.material_name); mat_name = mesh.material_name or mesh.name
 
         # Check for texture overrides
         ovr = texture_overrides.get(mi, {}) if texture_overrides else {}
 
-        tex_s0 = ovr.get('TexS0', _ensure_dds(mat.map_kd) if mat else "")
-        tex_s1 = ovr.get('TexS1', _ensure_dds(mat.map_bump) if mat else "")
-        tex_s2 = ovr.get('TexS2', _ensure_dds(mat.map_ka) if mat else "")
-        sn = ovr.get('ShaderName', shader_name)
-
-        dest_color = [mat.kd[0],mat.kd[1],mat.kd[2],mat.alpha] if mat else [0.5,0.5,0.5,1.0]
-        spec_color = [mat.ks[0],mat.ks[1],mat.ks[2],mat.ns] if mat else [0.5,0.5,0.5,16.0]
-        alpha = mat.alpha if mat else 1.0
-
-        write_chunk(CHUNK_STRING, "Name", mat_name.encode('ascii', errors='replace'))
-        write_chunk(CHUNK_STRING, "ShaderName", sn.encode('ascii', errors='replace'))
-        write_chunk(CHUNK_STRING, "TexS0", tex_s0.encode('ascii', errors='replace'))
-        write_chunk(CHUNK_STRING, "TexS1", tex_s1.encode('ascii', errors='replace'))
-        write_chunk(CHUNK_STRING, "TexS2", tex_s2.encode('ascii', errors='replace'))
-        write_chunk(CHUNK_VEC4, "SpecColor", struct.pack('<4f', *spec_color))
-        write_chunk(CHUNK_VEC4, "DestColor", struct.pack('<4f', *dest_color))
-        write_chunk(CHUNK_FLOAT, "Alpha", struct.pack('<f', alpha))
-        write_chunk(CHUNK_FLOAT, "NearRange", struct.pack('<f', near_range))
-        write_chunk(CHUNK_FLOAT, "FarRange", struct.pack('<f', far_range))
+        if mtr is None:
+            # Only derive the material's texture name when no override is given
+            tex_s0 = ovr['TexS0'] if 'TexS0' in ovr else (_ensure_dds(mat.map_kd) if mat else "")
+            tex_s1 = ovr['TexS1'] if 'TexS1' in ovr else (_ensure_dds(mat.map_bump) if mat else "")
+            tex_s2 = ovr['TexS2'] if 'TexS2' in ovr else (_ensure_dds(mat.map_ka) if mat else "")
+        else:
+            # The MTR ignores overrides and always carries the default ranges
+            tex = _material_textures(mat)
+            _emit_shader_child(mtr, mat, mat_name, shader_name, tex, DEFAULT_NEAR_RANGE, DEFAULT_FAR_RANGE)
+            tex_s0 = ovr.get('TexS0', tex[0]); tex_s1 = ovr.get('TexS1', tex[1]); tex_s2 = ovr.get('TexS2', tex[2])
 
-        end_child(sp)
-        end_child(mp)
+        _emit_shader_child(w, mat, mat_name, ovr.get('ShaderName', shader_name),
+                           (tex_s0, tex_s1, tex_s2), near_range, far_range)
+        w.end_child(mp)
 
-    return w.getvalue()
+    return w.get_bytes(), (mtr.get_bytes() if mtr is not None else None)
 
 
 def build_vdf_from_metadata(meshes, metadata, texture_overrides=None):
@@ -961,47 +1170,23 @@ def build_vdf_from_metadata(meshes, metadata, texture_overrides=None):
         # Apply texture overrides if provided
         if texture_overrides and i in texture_overrides:
             ovr = texture_overrides[i]
-            for child in mn.children:
-                if child.node_type == -253:
-                    for key in ('TexS0','TexS1','TexS2','ShaderName'):
-                        if key in ovr and ovr[key]:
-                            child.set_chunk_value(key, ovr[key])
-                    break
+            shader = next((c for c in mn.children if c.node_type == -253), None)
+            if shader is not None:
+                for key in ('TexS0','TexS1','TexS2','ShaderName'):
+                    if key in ovr and ovr[key]:
+                        shader.set_chunk_value(key, ovr[key])
 
     return ntf_to_bytes(skeleton_root)
 
 
 def build_mtr(meshes, materials, shader_name=DEFAULT_SHADER,
               near_range=DEFAULT_NEAR_RANGE, far_range=DEFAULT_FAR_RANGE):
-    w = BytesIO()
-    w.write(struct.pack('<I', NTF_MAGIC_INT))
-    def write_chunk(ct, name, payload):
-        name_b = name.encode('ascii', errors='replace')
-        content = struct.pack('<B', ct) + struct.pack('<I', len(name_b)) + name_b + payload
-        w.write(b'\x01'); w.write(struct.pack('<I', len(content)+4)); w.write(content)
-    def begin_child(child_type):
-        w.write(b'\x02'); sp = w.tell(); w.write(struct.pack('<I', 0))
-        w.write(struct.pack('<i', child_type)); return sp
-    def end_child(sp):
-        end = w.tell(); w.seek(sp); w.write(struct.pack('<I', end-sp)); w.seek(end)
+    w = NTFBuilder(256 * len(meshes))
     for mesh in meshes:
         mat = materials.get(mesh.material_name)
-        mn = mesh.material_name or mesh.name
-        sp = begin_child(CHILD_SHADER)
-        write_chunk(CHUNK_STRING, "Name", mn.encode('ascii','replace'))
-        write_chunk(CHUNK_STRING, "ShaderName", shader_name.encode('ascii','replace'))
-        write_chunk(CHUNK_STRING, "TexS0", _ensure_dds(mat.map_kd if mat else "").encode('ascii','replace'))
-        write_chunk(CHUNK_STRING, "TexS1", _ensure_dds(mat.map_bump if mat else "").encode('ascii','replace'))
-        write_chunk(CHUNK_STRING, "TexS2", _ensure_dds(mat.map_ka if mat else "").encode('ascii','replace'))
-        dc = [mat.kd[0],mat.kd[1],mat.kd[2],mat.alpha] if mat else [0.5,0.5,0.5,1.0]
-        sc = [mat.ks[0],mat.ks[1],mat.ks[2],mat.ns] if mat else [0.5,0.5,0.5,16.0]
-        write_chunk(CHUNK_VEC4, "SpecColor", struct.pack('<4f', *sc))
-        write_chunk(CHUNK_VEC4, "DestColor", struct.pack('<4f', *dc))
-        write_chunk(CHUNK_FLOAT, "Alpha", struct.pack('<f', mat.alpha if mat else 1.0))
-        write_chunk(CHUNK_FLOAT, "NearRange", struct.pack('<f', DEFAULT_NEAR_RANGE))
-        write_chunk(CHUNK_FLOAT, "FarRange", struct.pack('<f', DEFAULT_FAR_RANGE))
-        end_child(sp)
-    return w.getvalue()
+        _emit_shader_child(w, mat, mesh.material_name or mesh.name, shader_name, _material_textures(mat),
+                           DEFAULT_NEAR_RANGE, DEFAULT_FAR_RANGE)
+    return w.get_bytes()
 
 
 # ╔═══════════════════════════════════════════════════════════════════════════════╗
@@ -1011,11 +1196,22 @@ def build_mtr(meshes, materials, shader_name=DEFAULT_SHADER,
 def build_texture_index(textures_root):
     index = {}
     if not textures_root or not os.path.isdir(textures_root): return index
-    for dirpath, _, filenames in os.walk(textures_root):
-        for fname in filenames:
-            if fname.upper().endswith('.DDS'):
-                key = fname.upper()
-                if key not in index: index[key] = os.path.join(dirpath, fname)
+    # Iterative scandir walk; subdirs are pushed in reverse so the visit order
+    # (and therefore which duplicate name wins) matches os.walk. is_dir() and
+    # is_symlink() are answered from the listing, so no per-file stat() is made.
+    stack = [textures_root]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    if e.is_dir():
+                        if not e.is_symlink(): subdirs.append(e.path)
+                        continue
+                    key = e.name.upper()
+                    if key.endswith('.DDS'): index.setdefault(key, e.path)
+        except OSError: pass
+        stack.extend(reversed(subdirs))
     return index
 
 def find_textures_folder(input_folder):
@@ -1035,30 +1231,35 @@ def find_textures_folder(input_folder):
 # ║  VDF FILE SCANNER                                                            ║
 # ╚═══════════════════════════════════════════════════════════════════════════════╝
 
-def find_vdf_pairs(folder):
-    folder = Path(folder)
-    all_vdf = sorted(folder.glob('*.vdf'), key=lambda p: p.name.upper())
+def _pair_vdf_files(files):
     lod_files = {}; base_files = []
-    for vdf in all_vdf:
+    for vdf in files:
         if vdf.stem.upper().endswith('_LOD'):
             lod_files[vdf.stem[:-4].upper()] = vdf
         else:
             base_files.append(vdf)
+    # Pairing doesn't depend on order; only the resulting base list is sorted
+    base_files.sort(key=lambda p: p.name.upper())
     pairs = []
     for base in base_files:
         lod = lod_files.get(base.stem.upper())
         pairs.append((base, lod, base.stem))
     return pairs
 
+def find_vdf_pairs(folder):
+    return _pair_vdf_files(Path(folder).glob('*.vdf'))
+
 def find_vdf_pairs_recursive(root_folder):
     root = Path(root_folder).resolve(); all_results = []
-    vdf_dirs = set()
+    # One walk: group the VDFs by directory as they are found (normcase keeps
+    # glob's case rules: insensitive on Windows, exact elsewhere)
+    vdf_dirs = {}
     for dirpath, _, filenames in os.walk(root):
-        for f in filenames:
-            if f.upper().endswith('.VDF'):
-                vdf_dirs.add(dirpath); break
+        files = [f for f in filenames if os.path.normcase(f[-4:]) == '.vdf']
+        if files:
+            d = Path(dirpath); vdf_dirs[dirpath] = [d / f for f in files]
     for vdf_dir in sorted(vdf_dirs):
-        pairs = find_vdf_pairs(vdf_dir)
+        pairs = _pair_vdf_files(vdf_dirs[vdf_dir])
         rel = os.path.relpath(vdf_dir, root)
         if rel == '.': rel = ''
         for base, lod, display in pairs:
@@ -1074,13 +1275,10 @@ def find_vdf_pairs_recursive(root_folder):
 def convert_vdf_to_obj(base_path, lod_path, output_dir, log_func=None,
                        tex_index=None, metadata_dir=None):
     """Convert VDF → OBJ + MTL + metadata JSON. Returns (obj_path, stats)."""
-    def log(msg):
-        if log_func: log_func(msg)
+    log = log_func or _log_noop
     base_name = Path(base_path).stem
     log(f"  Parsing {Path(base_path).name}...")
-    with open(base_path, 'rb') as f:
-        base_data = f.read()
-    root = parse_ntf_bytes(base_data)
+    root = parse_ntf_file(base_path)
     base_meshes = extract_meshes_from_ntf(root)
     if not base_meshes:
         raise ValueError(f"No mesh data in {Path(base_path).name}")
@@ -1088,8 +1286,7 @@ def convert_vdf_to_obj(base_path, lod_path, output_dir, log_func=None,
     lod_meshes = []
     if lod_path and os.path.isfile(str(lod_path)):
         log(f"  Parsing {Path(str(lod_path)).name} (LOD)...")
-        with open(str(lod_path), 'rb') as f:
-            lod_root = parse_ntf_bytes(f.read())
+        lod_root = parse_ntf_file(str(lod_path))
         lod_meshes = extract_meshes_from_ntf(lod_root)
 
     mesh_groups = []; materials = {}
@@ -1118,30 +1315,35 @@ def convert_vdf_to_obj(base_path, lod_path, output_dir, log_func=None,
         log(f"  Metadata: {base_name}_vdf_metadata.json")
 
     # Copy textures
-    all_textures = set()
+    tex_keys = {}  # name -> upper-case tex_index key, computed once per texture
     for mat in materials.values():
         for t in (mat.tex_diffuse, mat.tex_bump, mat.tex_lightmap):
-            if t: all_textures.add(t)
+            if t and t not in tex_keys: tex_keys[t] = t.upper()
+    all_textures = set(tex_keys)
     tex_found = tex_missing = 0; tex_missing_names = []
     if tex_index and all_textures:
         for tn in sorted(all_textures):
             dest = os.path.join(output_dir, tn)
             if os.path.exists(dest): tex_found += 1; continue
-            src = tex_index.get(tn.upper())
+            src = tex_index.get(tex_keys[tn])
             if src and os.path.isfile(src):
-                try: shutil.copy2(src, dest); tex_found += 1
+                # Copied via temp + replace: another import worker may be
+                # copying the same texture into this folder right now
+                try:
+                    with open(src, 'rb') as sf:
+                        _replace_file(dest, lambda f: shutil.copyfileobj(sf, f))
+                    shutil.copystat(src, dest); tex_found += 1
                 except: tex_missing += 1; tex_missing_names.append(tn)
             else: tex_missing += 1; tex_missing_names.append(tn)
 
-    total_verts = sum(len(m.positions) for _,m in mesh_groups)
-    total_tris = sum(len(m.faces) for _,m in mesh_groups)
+    # Per-mesh counts are taken once; the totals are the base + LOD sums
+    base_verts = sum([len(m.positions) for m in base_meshes]); base_tris = sum([len(m.faces) for m in base_meshes])
+    lod_verts = sum([len(m.positions) for m in lod_meshes]); lod_tris = sum([len(m.faces) for m in lod_meshes])
     stats = {
         'groups': len(mesh_groups), 'materials': len(materials),
-        'total_verts': total_verts, 'total_tris': total_tris,
-        'base_verts': sum(len(m.positions) for m in base_meshes),
-        'base_tris': sum(len(m.faces) for m in base_meshes),
-        'lod_verts': sum(len(m.positions) for m in lod_meshes),
-        'lod_tris': sum(len(m.faces) for m in lod_meshes),
+        'total_verts': base_verts + lod_verts, 'total_tris': base_tris + lod_tris,
+        'base_verts': base_verts, 'base_tris': base_tris,
+        'lod_verts': lod_verts, 'lod_tris': lod_tris,
         'has_lod': len(lod_meshes) > 0,
         'textures': all_textures, 'tex_found': tex_found,
         'tex_missing': tex_missing, 'tex_missing_names': tex_missing_names,
@@ -1149,13 +1351,34 @@ def convert_vdf_to_obj(base_path, lod_path, output_dir, log_func=None,
     return obj_path, stats
 
 
+# Batch import runs convert_vdf_to_obj in worker processes. The texture index
+# and metadata dir are handed to each worker once via the pool initializer
+# instead of being pickled with every job.
+_IMPORT_WORKER = {}
+
+def _import_worker_init(tex_index, metadata_dir):
+    _IMPORT_WORKER['tex_index'] = tex_index
+    _IMPORT_WORKER['metadata_dir'] = metadata_dir
+
+def _import_job(base_path, lod_path, output_dir):
+    """Process-pool entry point for one VDF → OBJ conversion.
+    Returns (log_lines, stats, error) — log callbacks can't cross processes."""
+    lines = []
+    try:
+        _, stats = convert_vdf_to_obj(base_path, lod_path, output_dir, lines.append,
+                                      tex_index=_IMPORT_WORKER.get('tex_index'),
+                                      metadata_dir=_IMPORT_WORKER.get('metadata_dir'))
+        return lines, stats, None
+    except Exception as e:
+        return lines, None, str(e)
+
+
 def convert_obj_to_vdf(obj_path, output_dir, shader_name=DEFAULT_SHADER,
                        near_range=DEFAULT_NEAR_RANGE, far_range=DEFAULT_FAR_RANGE,
                        write_mtr_file=True, metadata=None, texture_overrides=None,
                        log_func=None):
     """Convert OBJ → VDF + MTR. Returns (vdf_path, stats)."""
-    def log(msg):
-        if log_func: log_func(msg)
+    log = log_func or _log_noop
     base_name = Path(obj_path).stem
     log(f"Parsing {Path(obj_path).name}...")
     obj_data = parse_obj(obj_path, log_func)
@@ -1164,39 +1387,48 @@ def convert_obj_to_vdf(obj_path, output_dir, shader_name=DEFAULT_SHADER,
     log("Processing vertices and tangents...")
     meshes = [process_group(obj_data, g, log_func) for g in obj_data.groups]
 
+    mtr_data = None
     if metadata:
         log("Building VDF from metadata template...")
         vdf_data = build_vdf_from_metadata(meshes, metadata, texture_overrides)
     else:
         log("Building VDF from scratch...")
-        vdf_data = build_vdf_from_scratch(meshes, obj_data.materials, shader_name,
-                                          near_range, far_range, texture_overrides)
+        vdf_data, mtr_data = build_vdf_and_mtr(meshes, obj_data.materials, shader_name, near_range,
+                                               far_range, texture_overrides, with_mtr=write_mtr_file)
 
-    os.makedirs(output_dir, exist_ok=True)
     vdf_path = os.path.join(output_dir, f"{base_name}.vdf")
-    with open(vdf_path, 'wb') as f:
+    # Only create output_dir when the open fails, so repeat exports into the
+    # same folder skip the makedirs stat/mkdir calls.
+    try: f = open(vdf_path, 'wb')
+    except FileNotFoundError:
+        os.makedirs(output_dir, exist_ok=True); f = open(vdf_path, 'wb')
+    # One write() of the finished buffer: BufferedWriter passes anything
+    # larger than its buffer straight to the file, so no 8 KiB chunking.
+    with f:
         f.write(vdf_data)
     log(f"Wrote {vdf_path} ({len(vdf_data)} bytes)")
 
     mtr_path = None
     if write_mtr_file:
-        mtr_data = build_mtr(meshes, obj_data.materials, shader_name, near_range, far_range)
+        if mtr_data is None:
+            mtr_data = build_mtr(meshes, obj_data.materials, shader_name, near_range, far_range)
         mtr_path = os.path.join(output_dir, f"{base_name}.mtr")
         with open(mtr_path, 'wb') as f:
             f.write(mtr_data)
         log(f"Wrote {mtr_path}")
 
-    total_verts = sum(len(m.positions) for m in meshes)
-    total_tris = sum(len(m.indices)//3 for m in meshes)
+    # Index lists are always whole triangles, so one index total covers both
+    total_verts = total_idx = 0
+    for m in meshes: total_verts += len(m.positions); total_idx += len(m.indices)
+    textures = dict.fromkeys(chain.from_iterable(
+        map(_material_textures, obj_data.materials.values())))
+    textures.pop("", None)
     stats = {
-        'groups': len(meshes), 'total_verts': total_verts, 'total_tris': total_tris,
+        'groups': len(meshes), 'total_verts': total_verts,
+        'total_tris': total_idx // 3,
         'vdf_size': len(vdf_data), 'mtr_path': mtr_path,
-        'textures': [], 'used_metadata': metadata is not None,
+        'textures': list(textures), 'used_metadata': metadata is not None,
     }
-    for mat in obj_data.materials.values():
-        for t in (mat.map_kd, mat.map_bump, mat.map_ka):
-            dt = _ensure_dds(t)
-            if dt and dt not in stats['textures']: stats['textures'].append(dt)
     return vdf_path, stats
 
 
@@ -1219,24 +1451,45 @@ def load_config():
     }
     if os.path.isfile(cfg_path):
         try:
-            with open(cfg_path, 'r') as f:
-                saved = json.load(f)
+            with open(cfg_path, 'rb') as f:
+                saved = _json_loads(f.read())
             defaults.update(saved)
         except: pass
     return defaults
 
 def save_config(cfg):
-    cfg_path = os.path.join(get_script_dir(), CONFIG_FILE)
-    try:
-        with open(cfg_path, 'w') as f:
-            json.dump(cfg, f, indent=2)
-    except: pass
+    # Swapped in atomically, so a crash or a concurrent save never leaves a
+    # truncated config behind
+    data = _json_dumps(cfg)
+    try: _replace_file(os.path.join(get_script_dir(), CONFIG_FILE), lambda f: f.write(data))
+    except OSError: pass
 
 
 # ╔═══════════════════════════════════════════════════════════════════════════════╗
 # ║  METADATA LIBRARY                                                            ║
 # ╚═══════════════════════════════════════════════════════════════════════════════╝
 
+_META_HEADER_RE = re.compile(rb'"(mesh_count|total_vertices|total_triangles)"\s*:\s*(\d+)')
+
+def _peek_metadata_header(filepath, head_size=4096):
+    """Read the summary counts from the top of a metadata JSON without parsing
+    the (potentially huge) base64 skeleton. Falls back to a full load if the
+    keys are not all found in the first head_size bytes."""
+    with open(filepath, 'rb') as fh:
+        head = fh.read(head_size)
+    found = {k.decode('ascii'): int(v) for k, v in _META_HEADER_RE.findall(head)}
+    if len(found) == 3: return found
+    return load_metadata(filepath)
+
+@functools.lru_cache(maxsize=32)
+def _load_metadata_cached(filepath, mtime):
+    return load_metadata(filepath)
+
+def load_metadata_cached(filepath):
+    """load_metadata memoized on (path, mtime); a rewritten file is reloaded.
+    The returned dict is shared between callers and must not be modified."""
+    return _load_metadata_cached(filepath, os.path.getmtime(filepath))
+
 def scan_metadata_library(metadata_dir):
     """Scan metadata directory for all JSON files. Returns list of (filename, display_info)."""
     results = []
@@ -1249,13 +1502,11 @@ def scan_metadata_library(metadata_dir):
             # Quick peek at mesh count
             info = display_name
             try:
-                with open(filepath, 'r') as fh:
-                    # Read only first few lines for speed
-                    data = json.load(fh)
-                    mc = data.get('mesh_count', '?')
-                    tv = data.get('total_vertices', '?')
-                    tt = data.get('total_triangles', '?')
-                    info = f"{display_name}  ({mc} meshes, {tv}v, {tt}t)"
+                data = _peek_metadata_header(filepath)
+                mc = data.get('mesh_count', '?')
+                tv = data.get('total_vertices', '?')
+                tt = data.get('total_triangles', '?')
+                info = f"{display_name}  ({mc} meshes, {tv}v, {tt}t)"
             except:
                 pass
             results.append((f, filepath, display_name, info))
@@ -1283,6 +1534,8 @@ else:
             self.config = load_config()
             self.cancel_flag = False
             self.is_running = False
+            self._log_bufs = {}   # log Text widget -> lines waiting for _log_flush
+            self._closing = False  # close requested, waiting for an editor save
 
             # Ensure metadata dir exists
             os.makedirs(self.config['metadata_dir'], exist_ok=True)
@@ -1291,6 +1544,21 @@ else:
             self._create_menu()
             self._create_tabs()
             self._create_statusbar()
+            self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        def _on_close(self):
+            """Window close / File > Exit: a running editor save is on a daemon
+            thread, so let it finish before the window (and process) goes."""
+            if self._ed_save_q is None: self.root.destroy(); return
+            if self._closing: return
+            self._closing = True
+            self._status("Finishing save before closing...", YELLOW)
+            self._close_when_saved()
+
+        def _close_when_saved(self):
+            if not self._closing: return   # save failed; close was called off
+            if self._ed_save_q is None: self.root.destroy()
+            else: self.root.after(100, self._close_when_saved)
 
         # ── Styles ────────────────────────────────────────────────────────────
         def _configure_styles(self):
@@ -1335,7 +1603,7 @@ else:
             fm = tk.Menu(mb, **mc)
             fm.add_command(label="Settings...", command=self._show_settings)
             fm.add_separator()
-            fm.add_command(label="Exit", command=self.root.quit)
+            fm.add_command(label="Exit", command=self._on_close)
             mb.add_cascade(label="File", menu=fm)
 
             hm = tk.Menu(mb, **mc)
@@ -1373,6 +1641,34 @@ else:
         def _status(self, text, color=FG_DIM):
             self.status_l.configure(text=f"  {text}", fg=color)
 
+        def _log_append(self, widget, msg):
+            """Queue a line for a read-only log widget; queued lines are inserted
+            together at most 100 ms later."""
+            buf = self._log_bufs.setdefault(widget, [])
+            buf.append(msg)
+            if len(buf) == 1: self.root.after(100, self._log_flush, widget)
+
+        def _log_flush(self, widget):
+            buf = self._log_bufs.pop(widget, None)
+            if not buf: return
+            widget.configure(state='normal')
+            widget.insert('end', '\n'.join(buf) + '\n')
+            widget.see('end')
+            widget.configure(state='disabled')
+
+        def _log_clear(self, widget):
+            self._log_bufs.pop(widget, None)
+            widget.configure(state='normal')
+            widget.delete('1.0', 'end')
+            widget.configure(state='disabled')
+
+        def _debounce(self, attr, delay, fn):
+            """Run fn once, `delay` ms after the last call for the same attr
+            (coalesces bursts of keystrokes into a single update)."""
+            prev = getattr(self, attr, None)
+            if prev: self.root.after_cancel(prev)
+            setattr(self, attr, self.root.after(delay, fn))
+
         # ══════════════════════════════════════════════════════════════════════
         # TAB 1 — VDF IMPORT
         # ══════════════════════════════════════════════════════════════════════
@@ -1440,12 +1736,15 @@ else:
             self.imp_log.pack(fill="x"); self.imp_log.configure(state='disabled')
 
             self.imp_pairs = []
+            self._imp_tree_items = []   # tree iids, parallel to imp_pairs
+            self._imp_pool = None
+            self._imp_futures = []   # (future, tree index, tree item) still pending
+            self._imp_done = self._imp_success = self._imp_errors = 0
+            self._imp_total = 0; self._imp_last_pct = -1
+            self._imp_running = set()
 
         def _imp_log(self, msg):
-            self.imp_log.configure(state='normal')
-            self.imp_log.insert('end', msg + '\n')
-            self.imp_log.see('end')
-            self.imp_log.configure(state='disabled')
+            self._log_append(self.imp_log, msg)
 
         def _imp_browse_file(self):
             p = filedialog.askopenfilename(title="Select VDF File",
@@ -1480,7 +1779,7 @@ else:
 
         def _imp_scan(self):
             self.imp_tree.delete(*self.imp_tree.get_children())
-            self.imp_pairs = []
+            self.imp_pairs = []; self._imp_tree_items = []
             inp = self.imp_input.get()
             if not inp: return
 
@@ -1492,8 +1791,9 @@ else:
             elif os.path.isdir(inp):
                 self.imp_pairs = find_vdf_pairs_recursive(inp)
 
-            for base, lod, display, rel in self.imp_pairs:
+            self._imp_tree_items = [
                 self.imp_tree.insert('', 'end', values=(display, "Yes" if lod else "\u2014", "Ready"))
+                for base, lod, display, rel in self.imp_pairs]
             self._imp_log(f"Found {len(self.imp_pairs)} VDF model(s)")
             self._status(f"{len(self.imp_pairs)} files found", GREEN)
 
@@ -1509,77 +1809,133 @@ else:
             if not output:
                 messagebox.showwarning("No Output", "Select an output folder."); return
 
-            self.cancel_flag = False
+            self.cancel_flag = self._imp_cancelling = False
             self.imp_btn_convert.configure(state='disabled')
             self.imp_btn_cancel.configure(state='normal')
             self.imp_progress['value'] = 0
             self.imp_progress['maximum'] = len(self.imp_pairs)
 
-            # Clear log
-            self.imp_log.configure(state='normal')
-            self.imp_log.delete('1.0', 'end')
-            self.imp_log.configure(state='disabled')
-
-            # Build texture index
-            tex_dir = self.imp_texdir.get()
-            tex_index = {}
-            if tex_dir and os.path.isdir(tex_dir):
-                self._imp_log(f"Scanning textures in {tex_dir}...")
-                tex_index = build_texture_index(tex_dir)
-                self._imp_log(f"  Found {len(tex_index)} DDS textures")
+            self._log_clear(self.imp_log)
 
             metadata_dir = self.config['metadata_dir']
             self.config['last_import_dir'] = self.imp_input.get()
             save_config(self.config)
+            self._imp_done = self._imp_success = self._imp_errors = 0
+            self._imp_total = len(self.imp_pairs); self._imp_last_pct = -1
+            self._imp_made_dirs = set()   # output dirs already created this run
 
-            # Start batch in after() loop for GUI responsiveness
-            self._imp_batch(0, tex_index, metadata_dir, output, 0, 0)
+            # Build the texture index on a background thread so the window stays
+            # responsive; the pool is started once it is ready.
+            tex_dir = self.imp_texdir.get()
+            if tex_dir and os.path.isdir(tex_dir):
+                self._imp_log(f"Scanning textures in {tex_dir}...")
+                q = queue.Queue()
+                def scan():
+                    try: q.put(build_texture_index(tex_dir))
+                    except Exception: q.put({})
+                threading.Thread(target=scan, daemon=True).start()
+                self._imp_wait_index(q, output, metadata_dir)
+            else:
+                self._imp_submit({}, output, metadata_dir)
 
-        def _imp_batch(self, idx, tex_index, metadata_dir, output, success, errors):
-            if self.cancel_flag or idx >= len(self.imp_pairs):
-                # Done
-                self.imp_btn_convert.configure(state='normal')
+        def _imp_wait_index(self, q, output, metadata_dir):
+            if self.cancel_flag:
+                self._imp_finish(len(self.imp_pairs)); return
+            try:
+                tex_index = q.get_nowait()
+            except queue.Empty:
+                self.root.after(50, self._imp_wait_index, q, output, metadata_dir); return
+            self._imp_log(f"  Found {len(tex_index)} DDS textures")
+            self._imp_submit(tex_index, output, metadata_dir)
+
+        def _imp_submit(self, tex_index, output, metadata_dir):
+            # Submit every file to a process pool up front; _imp_drain polls the
+            # futures from an after() loop and reports them as they finish.
+            self._imp_pool = ProcessPoolExecutor(max_workers=IMPORT_MAX_WORKERS,
+                                                 initializer=_import_worker_init,
+                                                 initargs=(tex_index, metadata_dir))
+            self._imp_futures = []
+            items = self._imp_tree_items
+            for idx, (base, lod, name, rel_dir) in enumerate(self.imp_pairs):
+                sub_output = os.path.join(output, rel_dir) if rel_dir else output
+                if sub_output not in self._imp_made_dirs:
+                    os.makedirs(sub_output, exist_ok=True); self._imp_made_dirs.add(sub_output)
+                fut = self._imp_pool.submit(_import_job, str(base), str(lod) if lod else None, sub_output)
+                item = items[idx] if idx < len(items) else None
+                if item: self.imp_tree.set(item, 'status', "Queued")
+                self._imp_futures.append((fut, idx, item))
+            self._imp_running = set()   # indices already shown as "Converting..."
+            self._imp_drain()
+
+        def _imp_drain(self):
+            total = self._imp_total
+            if not self._imp_futures:
+                self._imp_finish(total); return
+            if self.cancel_flag and not self._imp_cancelling:
+                # Drop queued jobs; the ones already in a worker can't be stopped,
+                # so keep polling until they finish writing their files.
+                self._imp_cancelling = True
+                for fut, _, _ in self._imp_futures: fut.cancel()
                 self.imp_btn_cancel.configure(state='disabled')
-                self._imp_log(f"\n{'='*50}")
-                if self.cancel_flag:
-                    self._imp_log(f"Cancelled at {idx}/{len(self.imp_pairs)}")
-                    self._status(f"Cancelled: {success} OK, {errors} errors", YELLOW)
-                else:
-                    self._imp_log(f"Done! {success} converted, {errors} errors")
-                    self._status(f"Done: {success} OK, {errors} errors", GREEN)
-                self._imp_log(f"{'='*50}")
-                return
-
-            base, lod, name, rel_dir = self.imp_pairs[idx]
-            items = self.imp_tree.get_children()
-            item = items[idx] if idx < len(items) else None
-            if item: self.imp_tree.set(item, 'status', "Converting...")
-
-            self.imp_progress['value'] = idx + 1
-            self.imp_progress_label.configure(
-                text=f"{name} — {idx+1}/{len(self.imp_pairs)} ({(idx+1)*100//len(self.imp_pairs)}%)")
-            self.root.update_idletasks()
-
-            sub_output = os.path.join(output, rel_dir) if rel_dir else output
-            os.makedirs(sub_output, exist_ok=True)
+                self._imp_log("\nCancelling...")
+                self._status("Cancelling — waiting for running conversions...", YELLOW)
 
-            try:
+            pending = []; last_name = None
+            for fut, idx, item in self._imp_futures:
+                if fut.cancelled():
+                    if item: self.imp_tree.set(item, 'status', "Cancelled")
+                    continue
+                if not fut.done():
+                    if item and idx not in self._imp_running and fut.running():
+                        self.imp_tree.set(item, 'status', "Converting..."); self._imp_running.add(idx)
+                    pending.append((fut, idx, item)); continue
+                name = last_name = self.imp_pairs[idx][2]
+                try:
+                    lines, stats, err = fut.result()
+                except Exception as e:
+                    lines, stats, err = [], None, str(e)
                 self._imp_log(f"\n[{name}]")
-                _, stats = convert_vdf_to_obj(
-                    str(base), str(lod) if lod else None, sub_output,
-                    self._imp_log, tex_index=tex_index, metadata_dir=metadata_dir)
-
-                lod_info = f" +LOD({stats['lod_verts']}v)" if stats['has_lod'] else ""
-                status = f"OK — {stats['base_verts']}v / {stats['base_tris']}t{lod_info}"
-                if item: self.imp_tree.set(item, 'status', status)
-                success += 1
-            except Exception as e:
-                if item: self.imp_tree.set(item, 'status', f"ERROR: {e}")
-                self._imp_log(f"  ERROR: {e}")
-                errors += 1
-
-            # Schedule next file
-            self.root.after(1, self._imp_batch, idx+1, tex_index, metadata_dir, output, success, errors)
+                for line in lines: self._imp_log(line)
+                if err is None:
+                    lod_info = f" +LOD({stats['lod_verts']}v)" if stats['has_lod'] else ""
+                    status = f"OK — {stats['base_verts']}v / {stats['base_tris']}t{lod_info}"
+                    if item: self.imp_tree.set(item, 'status', status)
+                    self._imp_success += 1
+                else:
+                    if item: self.imp_tree.set(item, 'status', f"ERROR: {err}")
+                    self._imp_log(f"  ERROR: {err}")
+                    self._imp_errors += 1
+                self._imp_done += 1
+            self._imp_futures = pending
+
+            # One progress update per poll, however many files finished in it;
+            # the label is only re-rendered when the percentage moves
+            if last_name is not None:
+                self.imp_progress['value'] = self._imp_done
+                pct = self._imp_done*100 // total
+                if pct != self._imp_last_pct:
+                    self._imp_last_pct = pct
+                    self.imp_progress_label.configure(
+                        text=f"{last_name} — {self._imp_done}/{total} ({pct}%)")
+
+            if pending: self.root.after(50, self._imp_drain)
+            else: self._imp_finish(total)
+
+        def _imp_finish(self, total):
+            for fut, _, _ in self._imp_futures: fut.cancel()
+            if self._imp_pool: self._imp_pool.shutdown(wait=False)
+            self._imp_pool = None; self._imp_futures = []
+            self.imp_btn_convert.configure(state='normal')
+            self.imp_btn_cancel.configure(state='disabled')
+            success, errors = self._imp_success, self._imp_errors
+            self._imp_log(f"\n{'='*50}")
+            if self.cancel_flag:
+                self._imp_log(f"Cancelled at {self._imp_done}/{total}")
+                self._status(f"Cancelled: {success} OK, {errors} errors", YELLOW)
+            else:
+                self._imp_log(f"Done! {success} converted, {errors} errors")
+                self._status(f"Done: {success} OK, {errors} errors", GREEN)
+            self._imp_log(f"{'='*50}")
 
         # ══════════════════════════════════════════════════════════════════════
         # TAB 2 — OBJ EXPORT (OBJ → VDF)
@@ -1625,7 +1981,10 @@ else:
             meta_frame.columnconfigure(1, weight=1)
 
             self.exp_metadata_lib = []
+            self._exp_meta_by_info = {}; self._exp_meta_by_dname = {}   # -> index in lib
             self.exp_metadata_full = []
+            self.exp_metadata_full_lower = []
+            self._exp_last_query = None
             self._exp_refresh_metadata()
 
             # Shader settings + Texture fields (scrollable)
@@ -1637,18 +1996,20 @@ else:
             self.exp_vsb = ttk.Scrollbar(self.exp_mesh_frame_outer, orient="vertical",
                                           command=self.exp_canvas.yview)
             self.exp_mesh_frame = tk.Frame(self.exp_canvas, bg=BG)
-            self.exp_mesh_frame.bind("<Configure>",
-                lambda e: self.exp_canvas.configure(scrollregion=self.exp_canvas.bbox("all")))
+            self._exp_last_w = None; self._exp_layout_aid = None
+            self.exp_mesh_frame.bind("<Configure>", self._exp_on_inner_configure)
             self.exp_canvas.create_window((0,0), window=self.exp_mesh_frame, anchor="nw", tags="inn")
-            self.exp_canvas.bind("<Configure>",
-                lambda e: self.exp_canvas.itemconfig("inn", width=e.width-20))
+            self.exp_canvas.bind("<Configure>", self._exp_on_canvas_configure)
             self.exp_canvas.configure(yscrollcommand=self.exp_vsb.set)
             self.exp_vsb.pack(side="right", fill="y")
             self.exp_canvas.pack(fill="both", expand=True)
-            self.exp_canvas.bind_all("<MouseWheel>",
-                lambda e: self.exp_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
+            # Wheel scrolls the panels only while the pointer is over them
+            self.exp_mesh_frame_outer.bind("<Enter>", self._exp_wheel_enter)
+            self.exp_mesh_frame_outer.bind("<Leave>", self._exp_wheel_leave)
 
             self.exp_mesh_panels = []  # List of dicts with StringVars for each mesh
+            self._exp_panel_pool = []  # (frame, title, vars) for every panel built so far
+            self._exp_panels_shown = 0
 
             # Default: show one generic panel
             self._exp_show_default_panels()
@@ -1669,9 +2030,7 @@ else:
             self.exp_log.pack(fill="x"); self.exp_log.configure(state='disabled')
 
         def _exp_log(self, msg):
-            self.exp_log.configure(state='normal')
-            self.exp_log.insert('end', msg + '\n'); self.exp_log.see('end')
-            self.exp_log.configure(state='disabled')
+            self._log_append(self.exp_log, msg)
 
         def _exp_browse_obj(self):
             p = filedialog.askopenfilename(title="Select OBJ File",
@@ -1681,64 +2040,107 @@ else:
                 if not self.exp_output.get():
                     self.exp_output.set(os.path.dirname(p))
 
+        def _exp_wheel(self, e):
+            self.exp_canvas.yview_scroll(int(-1*(e.delta/120)), "units")
+
+        def _exp_wheel_enter(self, e=None):
+            self.exp_canvas.bind_all("<MouseWheel>", self._exp_wheel)
+
+        def _exp_wheel_leave(self, e):
+            # <Leave> also fires when the pointer moves onto a child widget
+            w = self.root.winfo_containing(e.x_root, e.y_root)
+            # (match whole path segments: ".!frame2" must not claim ".!frame22")
+            outer = str(self.exp_mesh_frame_outer)
+            if w is not None and (str(w) == outer or str(w).startswith(outer + '.')): return
+            self.exp_canvas.unbind_all("<MouseWheel>")
+
+        # Resizing fires <Configure> continuously; coalesce into one layout per 50 ms
+        def _exp_on_inner_configure(self, e=None):
+            self._exp_schedule_layout()
+
+        def _exp_on_canvas_configure(self, e):
+            if e.width == self._exp_last_w: return
+            self._exp_last_w = e.width; self._exp_schedule_layout()
+
+        def _exp_schedule_layout(self):
+            if self._exp_layout_aid is None:
+                self._exp_layout_aid = self.root.after(50, self._exp_apply_layout)
+
+        def _exp_apply_layout(self):
+            self._exp_layout_aid = None
+            if self._exp_last_w is not None:
+                self.exp_canvas.itemconfig("inn", width=self._exp_last_w-20)
+            self.exp_canvas.configure(scrollregion=self.exp_canvas.bbox("all"))
+
         def _exp_browse_output(self):
             p = filedialog.askdirectory(title="Select output folder")
             if p: self.exp_output.set(p)
 
         def _exp_refresh_metadata(self):
             """Refresh the metadata library dropdown."""
-            lib = scan_metadata_library(self.config['metadata_dir'])
+            self._exp_set_metadata_lib(scan_metadata_library(self.config['metadata_dir']))
+
+        def _exp_set_metadata_lib(self, lib):
+            _load_metadata_cached.cache_clear()
             self.exp_metadata_lib = lib
+            # Lookup tables (first entry wins, like the scan they replace)
+            self._exp_meta_by_info = {}; self._exp_meta_by_dname = {}
+            for i, (fname, fpath, dname, info) in enumerate(lib):
+                self._exp_meta_by_info.setdefault(info, i)
+                self._exp_meta_by_dname.setdefault(dname, i)
             self.exp_metadata_full = [item[3] for item in lib]  # display info strings
+            self.exp_metadata_full_lower = [s.lower() for s in self.exp_metadata_full]
+            self._exp_last_query = None
             self.exp_meta_combo['values'] = self.exp_metadata_full
 
         def _exp_filter_metadata(self, event=None):
             """Live filter the metadata dropdown as user types."""
+            self._debounce('_exp_filter_aid', 80, self._exp_do_filter)
+
+        def _exp_do_filter(self):
             query = self.exp_meta_var.get().lower()
+            if query == self._exp_last_query: return  # e.g. arrow/modifier keys
+            self._exp_last_query = query
             if not query:
                 self.exp_meta_combo['values'] = self.exp_metadata_full
                 return
-            filtered = [s for s in self.exp_metadata_full if query in s.lower()]
+            full = self.exp_metadata_full
+            filtered = [full[i] for i, sl in enumerate(self.exp_metadata_full_lower) if query in sl]
             self.exp_meta_combo['values'] = filtered
 
         def _exp_metadata_selected(self, event=None):
             """When user selects a metadata from dropdown, load and show mesh panels."""
             sel = self.exp_meta_var.get()
             if not sel: return
-            # Find matching metadata
-            meta = None
-            for fname, fpath, dname, info in self.exp_metadata_lib:
-                if info == sel or dname == sel.split('  ')[0]:
-                    try:
-                        meta = load_metadata(fpath)
-                    except Exception as e:
-                        messagebox.showerror("Error", f"Failed to load metadata:\n{e}")
-                        return
-                    break
+            try:
+                meta = self._exp_find_metadata(sel)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load metadata:\n{e}")
+                return
             if meta:
                 self._exp_show_metadata_panels(meta)
             else:
                 self._exp_show_default_panels()
 
+        def _exp_find_metadata(self, sel):
+            """Load the library entry matching the combobox text (cached), or None."""
+            hits = [i for i in (self._exp_meta_by_info.get(sel),
+                                self._exp_meta_by_dname.get(sel.split('  ')[0])) if i is not None]
+            if not hits: return None
+            return load_metadata_cached(self.exp_metadata_lib[min(hits)][1])
+
         def _exp_show_default_panels(self):
             """Show a single default shader panel."""
-            for w in self.exp_mesh_frame.winfo_children(): w.destroy()
-            self.exp_mesh_panels = []
-
-            panel = self._create_mesh_panel(self.exp_mesh_frame, 0, "Default Mesh",
-                                             DEFAULT_SHADER, "", "", "")
-            self.exp_mesh_panels.append(panel)
+            self._exp_set_panels([("Default Mesh", DEFAULT_SHADER, "", "", "")])
 
         def _exp_show_metadata_panels(self, meta):
             """Show mesh panels from loaded metadata, pre-filled with shader info."""
-            for w in self.exp_mesh_frame.winfo_children(): w.destroy()
-            self.exp_mesh_panels = []
-
             meshes = meta.get('meshes', [])
             if not meshes:
                 self._exp_show_default_panels()
                 return
 
+            specs = []
             for i, mesh_info in enumerate(meshes):
                 shader = mesh_info.get('shader', {})
                 name = mesh_info.get('name', f'Mesh {i}')
@@ -1746,16 +2148,35 @@ else:
                 t0 = shader.get('TexS0', '')
                 t1 = shader.get('TexS1', '')
                 t2 = shader.get('TexS2', '')
-                panel = self._create_mesh_panel(self.exp_mesh_frame, i, name, sn, t0, t1, t2)
-                self.exp_mesh_panels.append(panel)
+                specs.append((name, sn, t0, t1, t2))
+            self._exp_set_panels(specs)
+
+        def _exp_set_panels(self, specs):
+            """Show one panel per (name, shader, tex0, tex1, tex2). Panels are kept in
+            a pool and refilled; only missing ones are created, extras are hidden.
+            Shown panels are always a prefix of the pool, so re-packing keeps order."""
+            pool = self._exp_panel_pool
+            for i, (name, sn, t0, t1, t2) in enumerate(specs):
+                if i < len(pool):
+                    frame, title, vars_dict = pool[i]
+                    title.configure(text=f"Mesh {i}: {name}")
+                    for key, val in (("ShaderName", sn), ("TexS0", t0), ("TexS1", t1), ("TexS2", t2)):
+                        vars_dict[key].set(val)
+                    if i >= self._exp_panels_shown: frame.pack(fill="x", pady=3, padx=2)
+                else:
+                    pool.append(self._create_mesh_panel(self.exp_mesh_frame, i, name, sn, t0, t1, t2))
+            for frame, _, _ in pool[len(specs):self._exp_panels_shown]: frame.pack_forget()
+            self._exp_panels_shown = len(specs)
+            self.exp_mesh_panels = [vars_dict for _, _, vars_dict in pool[:len(specs)]]
 
         def _create_mesh_panel(self, parent, index, name, shader, tex0, tex1, tex2):
-            """Create a single mesh shader/texture panel. Returns dict of StringVars."""
+            """Create a single mesh shader/texture panel. Returns (frame, title label, dict of StringVars)."""
             frame = tk.Frame(parent, bg=BG2, padx=10, pady=8)
             frame.pack(fill="x", pady=3, padx=2)
 
-            tk.Label(frame, text=f"Mesh {index}: {name}", font=("Segoe UI", 10, "bold"),
-                     bg=BG2, fg=CYAN).grid(row=0, column=0, columnspan=4, sticky='w', pady=(0,4))
+            title = tk.Label(frame, text=f"Mesh {index}: {name}", font=("Segoe UI", 10, "bold"),
+                             bg=BG2, fg=CYAN)
+            title.grid(row=0, column=0, columnspan=4, sticky='w', pady=(0,4))
 
             vars_dict = {}
             row = 1
@@ -1786,7 +2207,7 @@ else:
                 row += 1
 
             frame.columnconfigure(1, weight=1)
-            return vars_dict
+            return frame, title, vars_dict
 
         def _exp_browse_texture(self, string_var):
             p = filedialog.askopenfilename(title="Select DDS Texture",
@@ -1800,10 +2221,7 @@ else:
             output = self.exp_output.get()
             if not output: output = os.path.dirname(obj); self.exp_output.set(output)
 
-            # Clear log
-            self.exp_log.configure(state='normal')
-            self.exp_log.delete('1.0', 'end')
-            self.exp_log.configure(state='disabled')
+            self._log_clear(self.exp_log)
 
             # Collect texture overrides from panels
             texture_overrides = {}
@@ -1818,12 +2236,8 @@ else:
             metadata = None
             sel = self.exp_meta_var.get()
             if sel:
-                for fname, fpath, dname, info in self.exp_metadata_lib:
-                    if info == sel or dname == sel.split('  ')[0]:
-                        try:
-                            metadata = load_metadata(fpath)
-                        except: pass
-                        break
+                try: metadata = self._exp_find_metadata(sel)
+                except: pass
 
             # Get shader from first panel
             shader_name = DEFAULT_SHADER
@@ -1833,13 +2247,35 @@ else:
 
             self.exp_btn_convert.configure(state='disabled')
 
+            # Convert on a worker thread; log lines and the result come back
+            # through a queue drained by _exp_poll on the Tk thread.
+            self._exp_q = queue.Queue()
+            threading.Thread(target=self._exp_worker, daemon=True, args=(
+                obj, output, shader_name, self.exp_write_mtr.get(),
+                metadata, texture_overrides)).start()
+            self.root.after(100, self._exp_poll)
+
+        def _exp_worker(self, obj, output, shader_name, write_mtr, metadata, texture_overrides):
+            q = self._exp_q
             try:
-                vdf_path, stats = convert_obj_to_vdf(
-                    obj, output, shader_name=shader_name,
-                    write_mtr_file=self.exp_write_mtr.get(),
+                q.put(('done', convert_obj_to_vdf(
+                    obj, output, shader_name=shader_name, write_mtr_file=write_mtr,
                     metadata=metadata, texture_overrides=texture_overrides,
-                    log_func=self._exp_log)
+                    log_func=lambda m: q.put(('log', m)))))
+            except Exception as e:
+                q.put(('error', e))
+
+        def _exp_poll(self):
+            while True:
+                try: kind, val = self._exp_q.get_nowait()
+                except queue.Empty:
+                    self.root.after(100, self._exp_poll); return
+                if kind == 'log':
+                    self._exp_log(val); continue
+                break
 
+            if kind == 'done':
+                vdf_path, stats = val
                 self._exp_log(f"\n{'='*50}")
                 self._exp_log(f"Done! {vdf_path}")
                 self._exp_log(f"  {stats['total_verts']}v, {stats['total_tris']}t, {stats['groups']} groups")
@@ -1848,10 +2284,9 @@ else:
                     self._exp_log(f"  Used metadata template")
                 self._exp_log(f"{'='*50}")
                 self._status(f"OK — {stats['total_verts']}v / {stats['total_tris']}t", GREEN)
-
-            except Exception as e:
-                self._exp_log(f"\nERROR: {e}")
-                self._status(f"Error: {e}", RED)
+            else:
+                self._exp_log(f"\nERROR: {val}")
+                self._status(f"Error: {val}", RED)
 
             self.exp_btn_convert.configure(state='normal')
 
@@ -1884,6 +2319,7 @@ else:
                 b.pack(side="left", padx=2)
                 b.bind("<Enter>", lambda e, b=b: b.configure(bg=BG4))
                 b.bind("<Leave>", lambda e, b=b: b.configure(bg=BG3))
+                if cmd == self._ed_save: self.ed_save_btn = b
 
             # Paned: Tree | Detail
             self.ed_paned = tk.PanedWindow(tab, orient="horizontal", bg=BG,
@@ -1908,6 +2344,8 @@ else:
             self.ed_tree.configure(yscrollcommand=ed_vsb.set)
             ed_vsb.pack(side="right", fill="y")
             self.ed_tree.pack(fill="both", expand=True)
+            self.ed_tree.tag_configure("shader", foreground=YELLOW)
+            self.ed_tree.tag_configure("locator", foreground=CYAN)
             self.ed_tree.bind("<<TreeviewSelect>>", self._ed_on_select)
             self.ed_tree.bind("<Double-1>", self._ed_on_dblclick)
 
@@ -1916,13 +2354,32 @@ else:
             self.ed_paned.add(self.ed_detail, minsize=350)
 
             self.ed_filepath = None
+            self._ed_file_kind = None      # 'json' (metadata) or 'ntf', set with ed_filepath
             self.ed_ntf_root = None
             self.ed_modified = False
             self.ed_node_map = {}
+            self._ed_search_index = None   # [(iid, lowercase haystack)], built lazily
+            self._ed_search_slot = {}      # id(node) -> position in _ed_search_index
+            self._ed_search_blob = None    # (all haystacks joined, start offsets), built lazily
+            self._ed_stats = None          # cached _ed_tree_stats()
+            self._ed_cache = {}            # key -> (generation, value), see _ed_cached
+            self._ed_gen = 0               # bumped on every edit of the loaded tree
+            self._ed_save_q = None         # set while a background save is running
+            self._ed_written = None        # (path, root, gen, size, mtime_ns) of the last NTF save
+            self._ed_detail_view = None    # persistent node detail view, built on first use
+            self._ed_detail_canvas = None  # its virtualized chunk list
+            self._ed_detail_node = None
+            self._ed_detail_chunks = []    # its chunks, and their row text colours
+            self._ed_detail_colors = []
+            self._ed_detail_texts = []     # (type name, display value) per chunk, filled on first paint
+            self._ed_row_pool = []
+            self._ed_stats_view = None     # persistent statistics view
+            self._ed_refresh_aid = None    # pending after_idle refresh, see _ed_refresh_later
+            self._ed_refresh_node = None; self._ed_refresh_tree = False
             self._ed_show_welcome()
 
         def _ed_show_welcome(self):
-            for w in self.ed_detail.winfo_children(): w.destroy()
+            self._ed_clear_detail()
             f = tk.Frame(self.ed_detail, bg=BG); f.place(relx=0.5, rely=0.5, anchor="center")
             tk.Label(f, text="\U0001f4c4", font=("Segoe UI", 48), bg=BG, fg=ACCENT).pack()
             tk.Label(f, text="NTF Editor", font=("Segoe UI", 20, "bold"), bg=BG, fg=FG).pack(pady=(8,2))
@@ -1942,31 +2399,43 @@ else:
             if p: self._ed_load(p)
 
         def _ed_load(self, path):
+            kind = 'json' if path.endswith('.json') else 'ntf'
             try:
-                if path.endswith('.json'):
+                if kind == 'json':
                     meta = load_metadata(path)
                     self.ed_ntf_root = restore_ntf_from_metadata(meta)
                 else:
                     self.ed_ntf_root = parse_ntf_file(path)
-                self.ed_filepath = path; self.ed_modified = False
+                self.ed_filepath = path; self._ed_file_kind = kind; self.ed_modified = False
                 self._ed_populate_tree()
-                nn = count_nodes(self.ed_ntf_root); ns = len(find_shaders(self.ed_ntf_root))
-                self._status(f"Editor: {nn} nodes, {ns} shaders", GREEN)
+                st = self._ed_tree_stats()
+                self._status(f"Editor: {st['nodes']} nodes, {st['shaders']} shaders", GREEN)
                 self._ed_show_loaded()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load:\n{e}")
 
+        def _ed_tree_stats(self):
+            """Node/shader/texture counts of the loaded tree, computed once per
+            _ed_populate_tree (chunk edits don't change them)."""
+            if self._ed_stats is None:
+                shaders = find_shaders(self.ed_ntf_root)
+                self._ed_stats = {
+                    'nodes': len(self.ed_node_map), 'shaders': len(shaders),
+                    'textures': sum(1 for s in shaders for ch in s.chunks if ch.name in TEXTURE_FIELDS)}
+            return self._ed_stats
+
         def _ed_show_loaded(self):
-            for w in self.ed_detail.winfo_children(): w.destroy()
+            self._ed_clear_detail()
+            st = self._ed_tree_stats()
             f = tk.Frame(self.ed_detail, bg=BG, padx=20, pady=20); f.pack(fill="both", expand=True)
             tk.Label(f, text="\u2714  File Loaded", font=("Segoe UI", 16, "bold"),
                      bg=BG, fg=GREEN).pack(anchor="w", pady=(0,12))
             info = tk.Frame(f, bg=BG2, padx=16, pady=12); info.pack(fill="x")
             for label, val in [
                 ("File:", os.path.basename(self.ed_filepath)),
-                ("Nodes:", str(count_nodes(self.ed_ntf_root))),
-                ("Shaders:", str(len(find_shaders(self.ed_ntf_root)))),
-                ("Textures:", str(len(find_textures(self.ed_ntf_root)))),
+                ("Nodes:", str(st['nodes'])),
+                ("Shaders:", str(st['shaders'])),
+                ("Textures:", str(st['textures'])),
             ]:
                 r = tk.Frame(info, bg=BG2); r.pack(fill="x", pady=2)
                 tk.Label(r, text=label, font=("Segoe UI", 10, "bold"), bg=BG2, fg=FG_DIM,
@@ -1975,51 +2444,94 @@ else:
             tk.Label(f, text="\nSelect a node in the tree to view details.",
                      font=("Segoe UI", 10), bg=BG, fg=FG_DIM).pack(anchor="w")
 
-        def _ed_save(self):
-            if not self.ed_ntf_root or not self.ed_filepath: return self._ed_save_as()
+        def _ed_save(self, path=None, kind=None):
+            if path is None:
+                if not self.ed_ntf_root or not self.ed_filepath: return self._ed_save_as()
+                path, kind = self.ed_filepath, self._ed_file_kind
+            if self._ed_save_busy(): return
+            # Snapshot the tree here; encoding and writing run on a worker thread
+            try: raw = ntf_to_bytes(self.ed_ntf_root)
+            except Exception as e:
+                messagebox.showerror("Error", f"Save failed:\n{e}"); return
+            # Only retarget the editor once the save is actually going ahead
+            self.ed_filepath = path; self._ed_file_kind = kind
+            self.ed_modified = False   # edits made while saving set it again
+            self._ed_save_q = queue.Queue()
+            self.ed_save_btn.configure(state="disabled")
+            self._status(f"Saving {os.path.basename(path)}...", YELLOW)
+            self._ed_written = None
+            threading.Thread(target=self._ed_save_worker,
+                             args=(path, kind, raw, self._ed_save_q), daemon=True).start()
+            self.root.after(100, self._ed_save_poll, (path, self.ed_ntf_root, self._ed_gen))
+
+        def _ed_save_worker(self, path, kind, raw, q):
             try:
-                if self.ed_filepath.endswith('.json'):
+                stamp = None
+                if kind == 'json':
                     # Re-serialize to JSON by rebuilding metadata
-                    raw = ntf_to_bytes(self.ed_ntf_root)
-                    b64 = base64.b64encode(raw).decode('ascii')
-                    meta = load_metadata(self.ed_filepath)
-                    meta['raw_ntf_skeleton'] = b64
-                    save_metadata(self.ed_filepath, meta)
+                    meta = load_metadata(path)
+                    meta['raw_ntf_skeleton'] = base64.b64encode(raw).decode('ascii')
+                    save_metadata(path, meta)
                 else:
-                    save_ntf(self.ed_filepath, self.ed_ntf_root)
-                self.ed_modified = False
-                self._status(f"Saved: {os.path.basename(self.ed_filepath)}", GREEN)
+                    save_ntf(path, raw)
+                    st = os.stat(path); stamp = (st.st_size, st.st_mtime_ns)
+                q.put((path, None, stamp))
             except Exception as e:
-                messagebox.showerror("Error", f"Save failed:\n{e}")
+                q.put((path, e, None))
+
+        def _ed_save_poll(self, saved):
+            try: path, err, stamp = self._ed_save_q.get_nowait()
+            except queue.Empty:
+                self.root.after(100, self._ed_save_poll, saved); return
+            self._ed_save_q = None
+            self.ed_save_btn.configure(state="normal")
+            if err is None:
+                if stamp: self._ed_written = saved + stamp
+                self._status(f"Saved: {os.path.basename(path)}", GREEN)
+            else:
+                # Only flag the tree that was saved, not one loaded meanwhile
+                if saved[1] is self.ed_ntf_root: self.ed_modified = True
+                self._closing = False   # keep the window open so the save can be retried
+                messagebox.showerror("Error", f"Save failed:\n{err}")
+
+        def _ed_save_busy(self):
+            if self._ed_save_q is None: return False
+            self._status("Still saving — try again when the current save finishes", YELLOW)
+            return True
 
         def _ed_save_as(self):
-            if not self.ed_ntf_root: return
+            if not self.ed_ntf_root or self._ed_save_busy(): return
             ext = os.path.splitext(self.ed_filepath)[1] if self.ed_filepath else ".vdf"
             p = filedialog.asksaveasfilename(title="Save As", defaultextension=ext,
                 filetypes=[("VDF", "*.vdf"), ("MTR", "*.mtr"), ("All NTF", "*.vdf *.mtr *.chm"), ("All", "*.*")])
-            if p:
-                self.ed_filepath = p; self._ed_save()
+            if p: self._ed_save(p, 'json' if p.endswith('.json') else 'ntf')
 
         def _ed_populate_tree(self):
             self.ed_tree.delete(*self.ed_tree.get_children()); self.ed_node_map.clear()
-            if self.ed_ntf_root:
-                self._ed_add_node("", self.ed_ntf_root)
-                for item in self.ed_tree.get_children():
-                    self.ed_tree.item(item, open=True)
-                    for child in self.ed_tree.get_children(item):
-                        self.ed_tree.item(child, open=True)
+            self._ed_search_index = None; self._ed_stats = None; self._ed_cache.clear()
+            if not self.ed_ntf_root: return
+            # Unmap the tree during the bulk insert so Tk lays it out once
+            self.ed_tree.pack_forget()
+            try: self._ed_add_node("", self.ed_ntf_root)
+            finally: self.ed_tree.pack(fill="both", expand=True)
 
         def _ed_add_node(self, parent, node):
-            label = f"{node.icon}  {node.type_label}"
-            if node.name: label += f'  "{node.name}"'
-            tags = ()
-            if node.node_type == -253: tags = ("shader",)
-            elif node.data.get("IsLocator"): tags = ("locator",)
-            iid = self.ed_tree.insert(parent, "end", text=label, tags=tags)
-            self.ed_node_map[iid] = node
-            for child in node.children: self._ed_add_node(iid, child)
-            self.ed_tree.tag_configure("shader", foreground=YELLOW)
-            self.ed_tree.tag_configure("locator", foreground=CYAN)
+            """Insert node and its subtree (pre-order, explicit stack); the top two
+            levels are opened."""
+            # Straight Tcl "insert" calls: Treeview.insert() re-formats its option
+            # dict on every call, which dominates on trees with thousands of nodes.
+            call = self.ed_tree.tk.call; w = self.ed_tree._w; node_map = self.ed_node_map
+            stack = [(parent, node, 0)]
+            while stack:
+                parent, node, depth = stack.pop()
+                label = f"{node.icon}  {node.type_label}"
+                if node.name: label += f'  "{node.name}"'
+                tags = ()
+                if node.node_type == CHILD_SHADER: tags = ("shader",)
+                elif node.data.get("IsLocator"): tags = ("locator",)
+                iid = call(w, "insert", parent, "end", "-text", label, "-tags", tags, "-open", depth < 2)
+                node_map[iid] = node
+                stack.extend((iid, ch, depth + 1) for ch in reversed(node.children))
 
         def _ed_on_select(self, e=None):
             sel = self.ed_tree.selection()
@@ -2033,71 +2545,178 @@ else:
                 node = self.ed_node_map.get(sel[0])
                 if node:
                     for ch in node.chunks:
-                        if ch.chunk_type in (17,18,19,22):
+                        if ch.chunk_type in EDITABLE_CHUNK_TYPES:
                             self._ed_edit_chunk(ch, node); return
 
+        @staticmethod
+        def _ed_haystack(node):
+            """Lowercased name, type label and string values of a node, joined by
+            NUL so a query can't match across two fields."""
+            parts = [node.name, node.type_label]
+            parts += [str(ch.value) for ch in node.chunks if ch.chunk_type == 22]
+            return '\0'.join(parts).lower()
+
+        def _ed_build_search_index(self):
+            hay = self._ed_haystack
+            self._ed_search_index = [(iid, hay(node)) for iid, node in self.ed_node_map.items()]
+            self._ed_search_slot = {id(node): i for i, node in enumerate(self.ed_node_map.values())}
+            self._ed_search_blob = None
+
+        def _ed_reindex_node(self, node):
+            """Refresh one node's haystack after an edit instead of dropping the index."""
+            i = self._ed_search_slot.get(id(node))
+            if self._ed_search_index is None or i is None: return
+            self._ed_search_index[i] = (self._ed_search_index[i][0], self._ed_haystack(node))
+            self._ed_search_blob = None
+
         def _ed_on_search(self, *args):
+            self._debounce('_ed_search_aid', 80, self._ed_do_search)
+
+        def _ed_do_search(self):
             q = self.ed_search_var.get().lower().strip()
             if not q or not self.ed_ntf_root: return
-            for iid, node in self.ed_node_map.items():
-                if q in node.name.lower() or q in node.type_label.lower():
+            if self._ed_search_index is None: self._ed_build_search_index()
+            index = self._ed_search_index
+            if self._ed_search_blob is None:
+                # One string for all items so a search is a single str.find
+                # scan; offsets map a hit back to its item.
+                starts = []; pos = 0
+                for _, hay in index: starts.append(pos); pos += len(hay) + 1
+                self._ed_search_blob = ('\x01'.join(hay for _, hay in index), starts)
+            blob, starts = self._ed_search_blob
+            pos = blob.find(q)
+            while pos != -1:
+                i = bisect.bisect_right(starts, pos) - 1
+                if q in index[i][1]:   # rules out hits spanning two items
+                    iid = index[i][0]
                     self.ed_tree.see(iid); self.ed_tree.selection_set(iid); return
-                for ch in node.chunks:
-                    if ch.chunk_type == 22 and q in str(ch.value).lower():
-                        self.ed_tree.see(iid); self.ed_tree.selection_set(iid); return
-
-        def _ed_show_detail(self, node):
-            for w in self.ed_detail.winfo_children(): w.destroy()
-            hdr = tk.Frame(self.ed_detail, bg=BG3, padx=12, pady=10); hdr.pack(fill="x")
-            tk.Label(hdr, text=f"{node.icon}  {node.type_label}",
-                     font=("Segoe UI", 13, "bold"), bg=BG3, fg=FG).pack(anchor="w")
-            if node.name:
-                tk.Label(hdr, text=f'"{node.name}"', font=("Segoe UI", 11),
-                         bg=BG3, fg=ACCENT2).pack(anchor="w")
-            tk.Label(hdr, text=f"Type: {node.node_type}  |  Chunks: {len(node.chunks)}  |  Children: {len(node.children)}",
-                     font=("Segoe UI", 9), bg=BG3, fg=FG_DIM).pack(anchor="w", pady=(4,0))
-
-            if not node.chunks:
-                tk.Label(self.ed_detail, text="No chunks.", font=("Segoe UI", 10),
-                         bg=BG, fg=FG_DIM).pack(pady=20)
-                return
-
-            tf = tk.Frame(self.ed_detail, bg=BG); tf.pack(fill="both", expand=True, padx=8, pady=8)
+                pos = blob.find(q, starts[i+1]) if i+1 < len(starts) else -1
+
+        def _ed_clear_detail(self):
+            """Hide the persistent detail/stats views and destroy anything else."""
+            for w in self.ed_detail.winfo_children():
+                if w is self._ed_detail_view or w is self._ed_stats_view: w.pack_forget()
+                else: w.destroy()
+
+        def _ed_build_detail_view(self):
+            v = tk.Frame(self.ed_detail, bg=BG)
+            hdr = tk.Frame(v, bg=BG3, padx=12, pady=10); hdr.pack(fill="x")
+            self._ed_dv_title = tk.Label(hdr, font=("Segoe UI", 13, "bold"), bg=BG3, fg=FG)
+            self._ed_dv_title.pack(anchor="w")
+            self._ed_dv_name = tk.Label(hdr, font=("Segoe UI", 11), bg=BG3, fg=ACCENT2)
+            self._ed_dv_info = tk.Label(hdr, font=("Segoe UI", 9), bg=BG3, fg=FG_DIM)
+            self._ed_dv_info.pack(anchor="w", pady=(4,0))
+            self._ed_dv_empty = tk.Label(v, text="No chunks.", font=("Segoe UI", 10), bg=BG, fg=FG_DIM)
+
+            tf = self._ed_dv_list = tk.Frame(v, bg=BG)
             # Header row
-            ch = tk.Frame(tf, bg=BG3, padx=8, pady=4); ch.pack(fill="x")
-            tk.Label(ch, text="Field", font=("Segoe UI", 9, "bold"), bg=BG3, fg=FG_DIM,
-                     width=18, anchor="w").pack(side="left")
-            tk.Label(ch, text="Type", font=("Segoe UI", 9, "bold"), bg=BG3, fg=FG_DIM,
-                     width=12, anchor="w").pack(side="left")
-            tk.Label(ch, text="Value", font=("Segoe UI", 9, "bold"), bg=BG3, fg=FG_DIM,
-                     anchor="w").pack(side="left", fill="x", expand=True)
-
-            # Scrollable chunk list
+            ch = tk.Frame(tf, bg=BG3, height=ED_ROW_HEIGHT); ch.pack(fill="x")
+            for x, text in zip(ED_COL_X, ("Field", "Type", "Value")):
+                tk.Label(ch, text=text, font=("Segoe UI", 9, "bold"), bg=BG3,
+                         fg=FG_DIM).place(x=x, rely=0.5, anchor="w")
+
+            # Scrollable chunk list, drawn as canvas items. Only the rows in the
+            # viewport exist: a small pool of item groups is moved and relabelled
+            # as the view scrolls.
             canvas = tk.Canvas(tf, bg=BG, highlightthickness=0)
-            vsb = ttk.Scrollbar(tf, orient="vertical", command=canvas.yview)
-            cf = tk.Frame(canvas, bg=BG)
-            cf.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-            canvas.create_window((0,0), window=cf, anchor="nw", tags="inn")
-            canvas.bind("<Configure>", lambda e: canvas.itemconfig("inn", width=e.width-20))
-            canvas.configure(yscrollcommand=vsb.set)
+            vsb = self._ed_detail_vsb = ttk.Scrollbar(tf, orient="vertical", command=canvas.yview)
+            canvas.configure(yscrollcommand=self._ed_on_detail_scroll)
+            canvas.bind("<Configure>", self._ed_on_detail_configure)
+            canvas.tag_bind("edit", "<Button-1>", self._ed_on_edit_click)
+            canvas.tag_bind("edit", "<Enter>", lambda e: canvas.configure(cursor="hand2"))
+            canvas.tag_bind("edit", "<Leave>", lambda e: canvas.configure(cursor=""))
             vsb.pack(side="right", fill="y"); canvas.pack(fill="both", expand=True)
+            self._ed_detail_canvas = canvas; self._ed_row_pool = []
+            self._ed_edit_slots = {}   # edit glyph item -> its pool row
+            self._ed_detail_view = v
 
-            for i, chunk in enumerate(node.chunks):
-                bgc = BG2 if i%2==0 else BG
-                row = tk.Frame(cf, bg=bgc, padx=8, pady=4); row.pack(fill="x")
-                nc = GREEN if chunk.name in TEXTURE_FIELDS else (YELLOW if chunk.chunk_type==22 else FG)
-                tk.Label(row, text=chunk.name, font=("Consolas", 10), bg=bgc, fg=nc,
-                         width=18, anchor="w").pack(side="left")
-                tk.Label(row, text=chunk.type_name(), font=("Consolas", 9), bg=bgc, fg=FG_DIM,
-                         width=12, anchor="w").pack(side="left")
-                tk.Label(row, text=chunk.display_value(), font=("Consolas", 10), bg=bgc, fg=nc,
-                         anchor="w").pack(side="left", fill="x", expand=True)
-                if chunk.chunk_type in (17,18,19,22):
-                    eb = tk.Button(row, text="\u270E",
-                                   command=lambda c=chunk, n=node: self._ed_edit_chunk(c, n),
-                                   bg=bgc, fg=ACCENT, activebackground=BG4, bd=0, padx=4,
-                                   cursor="hand2", relief="flat", font=("Segoe UI", 10))
-                    eb.pack(side="right", padx=4)
+        def _ed_show_detail(self, node):
+            self._ed_clear_detail()
+            if self._ed_detail_view is None: self._ed_build_detail_view()
+            self._ed_dv_title.configure(text=f"{node.icon}  {node.type_label}")
+            if node.name:
+                self._ed_dv_name.configure(text=f'"{node.name}"')
+                self._ed_dv_name.pack(anchor="w", before=self._ed_dv_info)
+            else:
+                self._ed_dv_name.pack_forget()
+            chunks = node.chunks
+            self._ed_dv_info.configure(
+                text=f"Type: {node.node_type}  |  Chunks: {len(chunks)}  |  Children: {len(node.children)}")
+
+            same = node is self._ed_detail_node
+            self._ed_detail_node = node; self._ed_detail_chunks = chunks
+            # Row colours depend only on name/type, which edits never change
+            self._ed_detail_colors = [GREEN if c.name in TEXTURE_FIELDS else
+                                      (YELLOW if c.chunk_type == CHUNK_STRING else FG) for c in chunks]
+            self._ed_detail_texts = [None] * len(chunks)
+            for r in self._ed_row_pool: r[5] = None   # relabel every slot
+            if chunks:
+                self._ed_dv_empty.pack_forget()
+                self._ed_dv_list.pack(fill="both", expand=True, padx=8, pady=8)
+                canvas = self._ed_detail_canvas
+                if not same: canvas.yview_moveto(0)
+                self._ed_layout_rows(canvas.winfo_width(), canvas.winfo_height())
+            else:
+                self._ed_dv_list.pack_forget(); self._ed_dv_empty.pack(pady=20)
+            self._ed_detail_view.pack(fill="both", expand=True)
+
+        def _ed_on_detail_scroll(self, first, last):
+            self._ed_detail_vsb.set(first, last); self._ed_repaint_rows()
+
+        def _ed_on_detail_configure(self, e):
+            self._ed_layout_rows(e.width, e.height)
+
+        def _ed_layout_rows(self, width, height):
+            canvas = self._ed_detail_canvas; n = len(self._ed_detail_chunks)
+            canvas.configure(scrollregion=(0, 0, width, ED_ROW_HEIGHT*n))
+            pool = self._ed_row_pool
+            while len(pool) < height // ED_ROW_HEIGHT + 2:
+                pool.append(self._ed_make_row(canvas, len(pool)))
+            for r in pool:
+                y = r[6]
+                canvas.coords(r[0], 0, y, width, y + ED_ROW_HEIGHT)
+                canvas.coords(r[4], width - 12, y + ED_ROW_HEIGHT//2)
+            self._ed_repaint_rows()
+
+        def _ed_make_row(self, canvas, k):
+            """Pooled detail row k: [background, name, type, value, edit glyph, chunk index, y]."""
+            y = -ED_ROW_HEIGHT; ty = y + ED_ROW_HEIGHT//2; tag = f"s{k}"
+            r = [canvas.create_rectangle(0, y, 0, y + ED_ROW_HEIGHT, width=0, tags=tag),
+                 canvas.create_text(ED_COL_X[0], ty, anchor="w", font=("Consolas", 10), tags=tag),
+                 canvas.create_text(ED_COL_X[1], ty, anchor="w", font=("Consolas", 9), fill=FG_DIM, tags=tag),
+                 canvas.create_text(ED_COL_X[2], ty, anchor="w", font=("Consolas", 10), tags=tag),
+                 canvas.create_text(0, ty, anchor="e", text="\u270E", font=("Segoe UI", 10),
+                                    fill=ACCENT, tags=(tag, "edit")),
+                 None, y]
+            self._ed_edit_slots[r[4]] = r
+            return r
+
+        def _ed_repaint_rows(self):
+            canvas = self._ed_detail_canvas; chunks = self._ed_detail_chunks
+            colors = self._ed_detail_colors; texts = self._ed_detail_texts
+            first = max(0, int(canvas.canvasy(0)) // ED_ROW_HEIGHT)
+            for k, r in enumerate(self._ed_row_pool):
+                i = first + k
+                # Rows past the end are parked above the scroll region
+                y = i*ED_ROW_HEIGHT if i < len(chunks) else -ED_ROW_HEIGHT
+                if y != r[6]: canvas.move(f"s{k}", 0, y - r[6]); r[6] = y
+                if i >= len(chunks): r[5] = None; continue
+                if r[5] == i: continue
+                r[5] = i; chunk = chunks[i]; nc = colors[i]
+                t = texts[i]
+                if t is None: t = texts[i] = (chunk.type_name(), chunk.display_value())
+                canvas.itemconfig(r[0], fill=BG2 if i%2==0 else BG)
+                canvas.itemconfig(r[1], text=chunk.name, fill=nc)
+                canvas.itemconfig(r[2], text=t[0])
+                canvas.itemconfig(r[3], text=t[1], fill=nc)
+                canvas.itemconfig(r[4], state="normal" if chunk.chunk_type in EDITABLE_CHUNK_TYPES else "hidden")
+
+        def _ed_on_edit_click(self, e):
+            cur = self._ed_detail_canvas.find_withtag("current")
+            r = self._ed_edit_slots.get(cur[0]) if cur else None
+            if r is None or r[5] is None: return
+            node = self._ed_detail_node; chunk = self._ed_detail_chunks[r[5]]
+            if chunk.chunk_type in EDITABLE_CHUNK_TYPES: self._ed_edit_chunk(chunk, node)
 
         def _ed_edit_chunk(self, chunk, node):
             dlg = tk.Toplevel(self.root); dlg.title(f"Edit: {chunk.name}")
@@ -2122,8 +2741,12 @@ else:
                     elif chunk.chunk_type == 19: nv = float(nv)
                 except ValueError as e:
                     messagebox.showerror("Error", f"Invalid: {e}", parent=dlg); return
+                # Share one str per distinct name, as the parser does
+                if chunk.chunk_type == 22: nv = sys.intern(nv)
                 chunk.value = nv; self.ed_modified = True; dlg.destroy()
-                self._ed_show_detail(node)
+                self._ed_reindex_node(node)
+                self._ed_gen += 1
+                self._ed_refresh_later(node)
                 self._status(f"Changed {chunk.name} = {repr(nv)}", YELLOW)
             bf = tk.Frame(dlg, bg=BG); bf.pack(pady=8)
             tk.Button(bf, text="Cancel", command=dlg.destroy, bg=BG3, fg=FG, bd=0,
@@ -2133,10 +2756,30 @@ else:
             entry.bind("<Return>", lambda e: apply())
             entry.bind("<Escape>", lambda e: dlg.destroy())
 
+        def _ed_refresh_later(self, node=None, tree=False):
+            """Coalesce tree/detail refreshes after edits into one idle callback."""
+            if tree: self._ed_refresh_tree = True
+            if node is not None: self._ed_refresh_node = node
+            if self._ed_refresh_aid is None:
+                self._ed_refresh_aid = self.root.after_idle(self._ed_refresh)
+
+        def _ed_refresh(self):
+            self._ed_refresh_aid = None
+            if self._ed_refresh_tree:
+                self._ed_refresh_tree = False; self._ed_populate_tree()
+            node, self._ed_refresh_node = self._ed_refresh_node, None
+            if node is not None: self._ed_show_detail(node)
+
+        def _ed_cached(self, key, fn):
+            """fn() memoized until the next edit or reload of the tree."""
+            hit = self._ed_cache.get(key)
+            if hit and hit[0] == self._ed_gen: return hit[1]
+            v = fn(); self._ed_cache[key] = (self._ed_gen, v); return v
+
         def _ed_show_textures(self):
             if not self.ed_ntf_root: return
-            texs = find_textures(self.ed_ntf_root)
-            for w in self.ed_detail.winfo_children(): w.destroy()
+            texs = self._ed_cached('textures', lambda: find_textures(self.ed_ntf_root))
+            self._ed_clear_detail()
             hdr = tk.Frame(self.ed_detail, bg=BG3, padx=12, pady=10); hdr.pack(fill="x")
             tk.Label(hdr, text="\U0001f3a8  Texture References", font=("Segoe UI", 14, "bold"),
                      bg=BG3, fg=FG).pack(anchor="w")
@@ -2159,26 +2802,43 @@ else:
 
         def _ed_show_stats(self):
             if not self.ed_ntf_root: return
-            for w in self.ed_detail.winfo_children(): w.destroy()
-            nodes = find_nodes(self.ed_ntf_root, lambda n: True)
-            types = {}; fields = set(); bsz = 0
-            for n in nodes:
-                types[n.node_type] = types.get(n.node_type, 0)+1
-                for ch in n.chunks:
-                    fields.add(ch.name)
-                    if ch.chunk_type == 23: bsz += len(ch.value)
-            hdr = tk.Frame(self.ed_detail, bg=BG3, padx=12, pady=10); hdr.pack(fill="x")
+            self._ed_clear_detail()
+            nodes, types, fields, bsz = self._ed_cached('stats', self._ed_aggregate_stats)
+            if self._ed_stats_view is None: self._ed_build_stats_view()
+            for label, val in [("Nodes", str(nodes)), ("Binary", f"{bsz:,}b"),
+                               ("Fields", str(len(fields))), ("Shaders", str(types.get(CHILD_SHADER, 0)))]:
+                self._ed_stats_vals[label].configure(text=val)
+            self._ed_stats_view.pack(fill="both", expand=True)
+
+        def _ed_build_stats_view(self):
+            v = tk.Frame(self.ed_detail, bg=BG)
+            hdr = tk.Frame(v, bg=BG3, padx=12, pady=10); hdr.pack(fill="x")
             tk.Label(hdr, text="\U0001f4ca  Statistics", font=("Segoe UI", 14, "bold"),
                      bg=BG3, fg=FG).pack(anchor="w")
-            ct = tk.Frame(self.ed_detail, bg=BG, padx=16, pady=12); ct.pack(fill="both", expand=True)
+            ct = tk.Frame(v, bg=BG, padx=16, pady=12); ct.pack(fill="both", expand=True)
             cards = tk.Frame(ct, bg=BG); cards.pack(fill="x", pady=(0,12))
-            for label, val, color in [
-                ("Nodes", str(len(nodes)), CYAN), ("Binary", f"{bsz:,}b", YELLOW),
-                ("Fields", str(len(fields)), GREEN), ("Shaders", str(len(find_shaders(self.ed_ntf_root))), ORANGE),
-            ]:
+            self._ed_stats_vals = {}
+            for label, color in [("Nodes", CYAN), ("Binary", YELLOW), ("Fields", GREEN), ("Shaders", ORANGE)]:
                 c = tk.Frame(cards, bg=BG2, padx=12, pady=8); c.pack(side="left", padx=4, fill="x", expand=True)
-                tk.Label(c, text=val, font=("Segoe UI", 16, "bold"), bg=BG2, fg=color).pack()
+                val = self._ed_stats_vals[label] = tk.Label(c, font=("Segoe UI", 16, "bold"), bg=BG2, fg=color)
+                val.pack()
                 tk.Label(c, text=label, font=("Segoe UI", 9), bg=BG2, fg=FG_DIM).pack()
+            self._ed_stats_view = v
+
+        def _ed_aggregate_stats(self):
+            """Node count, per-type counts (shaders included), field names and raw
+            byte total, gathered in one walk of the tree."""
+            types = {}; fields = set(); bsz = 0; nodes = 0
+            t_get = types.get; f_add = fields.add
+            stack = [self.ed_ntf_root]; pop = stack.pop; push = stack.extend
+            while stack:
+                n = pop(); nodes += 1
+                nt = n.node_type; types[nt] = t_get(nt, 0)+1
+                for ch in n.chunks:
+                    f_add(ch.name)
+                    if ch.chunk_type == 23: bsz += len(ch.value)
+                push(n.children)
+            return nodes, types, fields, bsz
 
         def _ed_transplant(self):
             if not self.ed_ntf_root:
@@ -2196,25 +2856,39 @@ else:
             if not orig_shaders or not edit_shaders:
                 messagebox.showinfo("Transplant", "No shaders found in one of the files."); return
 
-            # Match and transplant
-            used = set(); count = 0
+            # Match and transplant; each original shader is used at most once, in order
+            by_name = defaultdict(deque)
+            for os_ in orig_shaders: by_name[os_.name].append(os_)
+            count = 0
             for es in edit_shaders:
-                for oi, os_ in enumerate(orig_shaders):
-                    if oi not in used and es.name == os_.name:
-                        es.entries = [(ENTRY_CHUNK, c.clone()) for c in os_.chunks]
-                        used.add(oi); count += 1; break
+                q = by_name.get(es.name)
+                if q:
+                    os_ = q.popleft()
+                    es.entries = _clone_entries(os_.chunks)
+                    count += 1
             if count:
-                self.ed_modified = True; self._ed_populate_tree()
+                self.ed_modified = True; self._ed_gen += 1
+                self._ed_refresh_later(tree=True)
                 self._status(f"Transplanted {count} shader(s)", GREEN)
                 messagebox.showinfo("Done", f"Transplanted {count} shader(s).\nDon't forget to save!")
             else:
                 self._status("No shaders matched", YELLOW)
 
+        def _ed_just_saved(self):
+            """True if the file is still exactly what the last save wrote from
+            this tree with no edit since: its bytes are ntf_to_bytes(root) by
+            construction, so the round-trip needs no re-serialize and compare."""
+            w = self._ed_written
+            if not w or w[:3] != (self.ed_filepath, self.ed_ntf_root, self._ed_gen): return False
+            try: st = os.stat(self.ed_filepath)
+            except OSError: return False
+            return (st.st_size, st.st_mtime_ns) == w[3:]
+
         def _ed_verify(self):
             if not self.ed_ntf_root or not self.ed_filepath: return
-            if self.ed_filepath.endswith('.json'):
+            if self._ed_file_kind == 'json':
                 messagebox.showinfo("Verify", "Verify is only available for NTF binary files."); return
-            if verify_roundtrip(self.ed_filepath, self.ed_ntf_root):
+            if self._ed_just_saved() or verify_roundtrip(self.ed_filepath, self.ed_ntf_root):
                 self._status("Verify: PASS — Byte-identical!", GREEN)
                 messagebox.showinfo("Verify", "\u2714 Byte-identical round-trip!")
             else:
@@ -2232,42 +2906,52 @@ else:
 
             f = tk.Frame(dlg, bg=BG, padx=20); f.pack(fill="x")
 
+            def pick(entry, title):
+                p = filedialog.askdirectory(title=title)
+                if p: entry.delete(0, "end"); entry.insert(0, p)
+
             tk.Label(f, text="Metadata Folder:", bg=BG, fg=FG, font=("Segoe UI", 10)).grid(
                 row=0, column=0, sticky='w', pady=4)
-            meta_var = tk.StringVar(value=self.config['metadata_dir'])
-            tk.Entry(f, textvariable=meta_var, font=("Consolas", 10), bg=BG3, fg=FG,
-                     insertbackground=FG, bd=0).grid(row=0, column=1, sticky='ew', padx=4, pady=4)
-            tk.Button(f, text="...", command=lambda: meta_var.set(
-                filedialog.askdirectory(title="Select Metadata Folder") or meta_var.get()),
+            meta_e = tk.Entry(f, font=("Consolas", 10), bg=BG3, fg=FG, insertbackground=FG, bd=0)
+            meta_e.insert(0, self.config['metadata_dir'])
+            meta_e.grid(row=0, column=1, sticky='ew', padx=4, pady=4)
+            tk.Button(f, text="...", command=lambda: pick(meta_e, "Select Metadata Folder"),
                 bg=BG3, fg=FG, bd=0, padx=8).grid(row=0, column=2, pady=4)
 
             tk.Label(f, text="Default Shader:", bg=BG, fg=FG, font=("Segoe UI", 10)).grid(
                 row=1, column=0, sticky='w', pady=4)
-            shader_var = tk.StringVar(value=self.config.get('default_shader', DEFAULT_SHADER))
-            ttk.Combobox(f, textvariable=shader_var, values=KNOWN_SHADERS,
-                         font=("Consolas", 10)).grid(row=1, column=1, sticky='ew', padx=4, pady=4)
+            shader_cb = ttk.Combobox(f, values=KNOWN_SHADERS, font=("Consolas", 10))
+            shader_cb.set(self.config.get('default_shader', DEFAULT_SHADER))
+            shader_cb.grid(row=1, column=1, sticky='ew', padx=4, pady=4)
 
             tk.Label(f, text="Textures Folder:", bg=BG, fg=FG, font=("Segoe UI", 10)).grid(
                 row=2, column=0, sticky='w', pady=4)
-            tex_var = tk.StringVar(value=self.config.get('default_textures_dir', ''))
-            tk.Entry(f, textvariable=tex_var, font=("Consolas", 10), bg=BG3, fg=FG,
-                     insertbackground=FG, bd=0).grid(row=2, column=1, sticky='ew', padx=4, pady=4)
-            tk.Button(f, text="...", command=lambda: tex_var.set(
-                filedialog.askdirectory(title="Select Textures Folder") or tex_var.get()),
+            tex_e = tk.Entry(f, font=("Consolas", 10), bg=BG3, fg=FG, insertbackground=FG, bd=0)
+            tex_e.insert(0, self.config.get('default_textures_dir', ''))
+            tex_e.grid(row=2, column=1, sticky='ew', padx=4, pady=4)
+            tk.Button(f, text="...", command=lambda: pick(tex_e, "Select Textures Folder"),
                 bg=BG3, fg=FG, bd=0, padx=8).grid(row=2, column=2, pady=4)
 
             f.columnconfigure(1, weight=1)
 
             def save():
-                self.config['metadata_dir'] = meta_var.get()
-                self.config['default_shader'] = shader_var.get()
-                self.config['default_textures_dir'] = tex_var.get()
-                os.makedirs(self.config['metadata_dir'], exist_ok=True)
-                save_config(self.config)
-                self.status_r.configure(text=f"Metadata: {os.path.basename(self.config['metadata_dir'])}")
-                self._exp_refresh_metadata()
+                self.config['metadata_dir'] = meta_e.get()
+                self.config['default_shader'] = shader_cb.get()
+                self.config['default_textures_dir'] = tex_e.get()
                 dlg.destroy()
-                self._status("Settings saved", GREEN)
+                # Folder creation, the config write and the library rescan run on
+                # a worker thread; _settings_poll applies the result.
+                cfg = dict(self.config); q = queue.Queue()
+                def work():
+                    try:
+                        os.makedirs(cfg['metadata_dir'], exist_ok=True)
+                        save_config(cfg)
+                        q.put((scan_metadata_library(cfg['metadata_dir']), None))
+                    except Exception as e:
+                        q.put((None, e))
+                threading.Thread(target=work, daemon=True).start()
+                self._status("Saving settings...", YELLOW)
+                self._settings_poll(q, cfg['metadata_dir'])
 
             bf = tk.Frame(dlg, bg=BG); bf.pack(pady=16)
             tk.Button(bf, text="Cancel", command=dlg.destroy, bg=BG3, fg=FG, bd=0,
@@ -2275,6 +2959,17 @@ else:
             tk.Button(bf, text="Save", command=save, bg=ACCENT, fg="#fff", bd=0,
                       padx=16, pady=6, font=("Segoe UI", 10, "bold")).pack(side="left", padx=4)
 
+        def _settings_poll(self, q, metadata_dir):
+            try: lib, err = q.get_nowait()
+            except queue.Empty:
+                self.root.after(50, self._settings_poll, q, metadata_dir); return
+            if err is not None:
+                self._status("Settings not saved", RED)
+                messagebox.showerror("Error", f"Failed to save settings:\n{err}"); return
+            self.status_r.configure(text=f"Metadata: {os.path.basename(metadata_dir)}")
+            self._exp_set_metadata_lib(lib)
+            self._status("Settings saved", GREEN)
+
         def _about(self):
             messagebox.showinfo("About",
                 f"TW1 VDF Toolkit v{VERSION}\n\n"
@@ -2292,4 +2987,5 @@ else:
 
 
 if __name__ == '__main__':
+    freeze_support()   # process-pool workers in frozen (PyInstaller) builds
     main()